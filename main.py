@@ -124,6 +124,7 @@ def main():
         print("\n\n🛑 Shutting down...")
         pipeline.camera.release()
         idle_manager.stop()
+        coordinator.shutdown()
         print("✓ Goodbye!")
         sys.exit(0)
     
@@ -177,6 +178,7 @@ def main():
         # Cleanup
         pipeline.camera.release()
         idle_manager.stop()
+        coordinator.shutdown()
         if config.system.debug_display:
             cv2.destroyAllWindows()
         logger.info("System stopped")
@@ -37,6 +37,7 @@ class FaceDetectionConfig:
     model: str = "hog"
     upsample_times: int = 1
     min_face_size: int = 80
+    detection_scale: float = 0.5
 
 
 @dataclass
@@ -81,6 +82,7 @@ class BehaviorsConfig:
     """Behavior system configuration."""
     enable_robot: bool = True
     gesture_speech_delay: float = 0.3
+    greeting_batch_window: float = 0.1
     timing: BehaviorTimingConfig = field(default_factory=BehaviorTimingConfig)
     idle: IdleBehaviorConfig = field(default_factory=IdleBehaviorConfig)
 
@@ -259,6 +261,7 @@ class ConfigLoader:
                 self.config.behaviors = BehaviorsConfig(
                     enable_robot=b.get('enable_robot', True),
                     gesture_speech_delay=b.get('gesture_speech_delay', 0.3),
+                    greeting_batch_window=b.get('greeting_batch_window', 0.1),
                     timing=timing,
                     idle=idle
                 )
@@ -14,11 +14,14 @@ This module ties together:
 Implements timing coordination, session tracking, and multi-person prioritization.
 """
 
+import sys
 import time
 import threading
 import logging
 import asyncio
-from typing import Optional, Dict, List, Set
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List
 from dataclasses import dataclass
 
 from ..events.event_system import EventManager, EventType, RecognitionEvent
@@ -29,7 +32,6 @@ from ..voice.tts_module import TTSManager, GreetingType as OldGreetingType
 from ..voice.greeting_selector import GreetingSelector, GreetingType, GreetingContext
 from ..voice.adaptive_tts_manager import AdaptiveTTSManager
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Try to import config (optional - falls back to defaults)
@@ -41,6 +43,27 @@ except ImportError:
     logger.warning("Config not available, using default coordinator settings")
 
 
+_RULE = "=" * 60
+
+# Layout for get_detailed_stats(), filled from get_stats()
+_STATS_TEMPLATE = (
+    _RULE + "\n"
+    "Greeting Coordinator Statistics\n"
+    + _RULE + "\n"
+    "Total greetings: {total_greetings}\n"
+    "Unique people greeted: {unique_people_greeted}\n"
+    "Greeting in progress: {greeting_in_progress}\n"
+    "Pending greetings: {pending_greetings}\n"
+    "\n"
+    "Latency Performance:\n"
+    "  Average: {avg_latency_ms:.1f}ms\n"
+    "  Minimum: {min_latency_ms:.1f}ms\n"
+    "  Maximum: {max_latency_ms:.1f}ms\n"
+    "  Target (<{target_latency_ms}ms): {latency_target}\n"
+    + _RULE
+)
+
+
 class GreetingCoordinator:
     """
     Coordinates recognition events with behaviors and speech.
@@ -57,6 +80,15 @@ class GreetingCoordinator:
     - Natural voice variation (OpenAI TTS)
     """
     
+    # Events seen before the reject path is specialized
+    hot_threshold = 100
+    
+    # Seconds a cached time-of-day bucket stays valid
+    TIME_OF_DAY_TTL = 60.0
+    
+    # Maximum queued greetings; lowest confidence is dropped beyond this
+    MAX_PENDING_GREETINGS = 32
+    
     def __init__(
         self,
         event_manager: EventManager,
@@ -65,7 +97,8 @@ class GreetingCoordinator:
         adaptive_tts: Optional[AdaptiveTTSManager] = None,  # New voice system
         greeting_selector: Optional[GreetingSelector] = None,  # New selector
         gesture_speech_delay: Optional[float] = None,
-        use_enhanced_voice: Optional[bool] = None  # Enable new voice system
+        use_enhanced_voice: Optional[bool] = None,  # Enable new voice system
+        batch_window: Optional[float] = None
     ):
         """
         Initialize greeting coordinator.
@@ -78,7 +111,11 @@ class GreetingCoordinator:
             greeting_selector: Greeting selector for variation (optional)
             gesture_speech_delay: Delay between gesture start and speech (default from config or 0.3)
             use_enhanced_voice: Use OpenAI TTS if available (default from config or True)
+            batch_window: Seconds to coalesce near-simultaneous recognitions before
+                picking who to greet (default from config or 0.1, 0 disables batching)
         """
+        target_latency_ms = 400
+        
         # Load from config if available
         if _CONFIG_AVAILABLE:
             try:
@@ -87,6 +124,9 @@ class GreetingCoordinator:
                     gesture_speech_delay = config.behaviors.gesture_speech_delay
                 if use_enhanced_voice is None:
                     use_enhanced_voice = config.tts.use_enhanced_voice
+                if batch_window is None:
+                    batch_window = config.behaviors.greeting_batch_window
+                target_latency_ms = config.performance.target_latency_ms
                 logger.info("Loaded coordinator settings from config")
             except Exception as e:
                 logger.warning(f"Failed to load coordinator config: {e}")
@@ -96,11 +136,14 @@ class GreetingCoordinator:
             gesture_speech_delay = 0.3
         if use_enhanced_voice is None:
             use_enhanced_voice = True
+        if batch_window is None:
+            batch_window = 0.1
         
         self.event_manager = event_manager
         self.behavior_manager = behavior_manager
         self.gesture_speech_delay = gesture_speech_delay
         self.use_enhanced_voice = use_enhanced_voice
+        self.batch_window = batch_window
         
         # TTS setup - prefer new system
         self.tts_manager = tts_manager
@@ -119,10 +162,20 @@ class GreetingCoordinator:
             logger.info("Using legacy TTS system")
         
         # Session tracking (AC: 6)
-        self.greeted_persons: Set[str] = set()  # Person names greeted this session
-        self.greeting_in_progress = False
-        self.greeting_lock = threading.Lock()
+        # Immutable snapshot of interned names greeted this session. Writers
+        # rebind the attribute to a new frozenset (atomic under the GIL), so
+        # readers on the recognition thread never need the greeting lock.
+        self._greeted_frozen: frozenset = frozenset()
+        # Set while a greeting is executing. Events arrive on the recognition
+        # thread and batch timer threads, so it is only tested-and-set, and
+        # cleared, under _pending_lock (see _claim_or_queue, _drain_pending).
+        self._busy = threading.Event()
         self.session_start = time.time()
+        self._tod_cache = (0.0, None)  # (refreshed_at, time_of_day)
+        self._ctx = GreetingContext()  # Reused by _speak_enhanced
+        
+        # Robot I/O runs here so it overlaps with speech
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="coord-io")
         
         # Performance metrics (AC: 4)
         self.total_greetings = 0
@@ -130,9 +183,20 @@ class GreetingCoordinator:
         self.avg_latency = 0.0
         self.max_latency = 0.0
         self.min_latency = float('inf')
+        self.target_latency_ms = target_latency_ms
+        self._latency_sum = 0.0
+        self._target_misses = 0  # Greetings whose initial response missed the target
+        
+        # Multi-person queue: heap of (-confidence, seq, event)
+        self._pending_heap: List[tuple] = []
+        self._pending_seq = 0
+        self._pending_lock = threading.Lock()
+        self._call_count = 0
         
-        # Multi-person queue
-        self.pending_greetings: List[RecognitionEvent] = []
+        # Recognitions collected during the current batch window
+        self._batch: List[RecognitionEvent] = []
+        self._batch_lock = threading.Lock()
+        self._batch_timer: Optional[threading.Timer] = None
         
         # Register event callback (AC: 1)
         self.event_manager.add_callback(
@@ -154,32 +218,144 @@ class GreetingCoordinator:
         Args:
             event: Recognition event with person details
         """
-        logger.info(f"🎯 COORDINATOR RECEIVED EVENT: {event.person_name}")
+        logger.info("🎯 COORDINATOR RECEIVED EVENT: %s", event.person_name)
         
-        # Check if already greeted this session (AC: 6)
-        if event.person_name in self.greeted_persons:
-            logger.debug(f"Already greeted {event.person_name}, skipping")
+        # Promote the reject path once it is clearly the hot one
+        self._call_count += 1
+        if self._call_count == self.hot_threshold:
+            self._fast_reject = self._specialize_fast_reject()
+        
+        if self._fast_reject(event):
             return
         
+        self._add_to_batch(event)
+    
+    def _fast_reject(self, event: RecognitionEvent) -> bool:
+        """
+        Cheap pre-check run for every recognition event.
+        
+        Args:
+            event: Recognition event with person details
+            
+        Returns:
+            True if the event was handled without greeting (already greeted
+            this session, or queued behind an in-flight greeting)
+        """
+        # Check if already greeted this session (AC: 6)
+        if sys.intern(event.person_name) in self._greeted_frozen:
+            logger.debug("Already greeted %s, skipping", event.person_name)
+            return True
+        
         # Check if greeting in progress
-        with self.greeting_lock:
-            if self.greeting_in_progress:
-                logger.debug(f"Greeting in progress, queueing {event.person_name}")
-                self.pending_greetings.append(event)
-                return
-            self.greeting_in_progress = True
+        if self._queue_if_busy(event):
+            logger.debug("Greeting in progress, queued %s", event.person_name)
+            return True
+        
+        return False
+    
+    def _specialize_fast_reject(self):
+        """
+        Build a specialized replacement for _fast_reject.
+        
+        The returned closure binds the interner and busy check-and-queue
+        to locals so the dominant reject path skips repeated attribute
+        lookups and debug logging. The greeted snapshot is still read from
+        the instance because it is rebound on every greeting.
+        
+        Returns:
+            Callable with the same contract as _fast_reject
+        """
+        intern = sys.intern
+        queue_if_busy = self._queue_if_busy
+        coordinator = self
         
+        def fast_reject(event: RecognitionEvent) -> bool:
+            if intern(event.person_name) in coordinator._greeted_frozen:
+                return True
+            return queue_if_busy(event)
+        
+        logger.debug("Specialized greeting reject path after %d events", self._call_count)
+        return fast_reject
+    
+    def _add_to_batch(self, event: RecognitionEvent):
+        """
+        Hold an event until the batch window closes.
+        
+        The first event of a burst starts the window timer; later events
+        within the window are collected so the highest-confidence person
+        can be greeted first (AC: 5).
+        
+        Args:
+            event: Recognition event that passed the reject check
+        """
+        if self.batch_window <= 0:
+            if self._claim_or_queue(event):
+                self._slow_execute(event)
+            return
+        
+        with self._batch_lock:
+            self._batch.append(event)
+            if self._batch_timer is None:
+                self._batch_timer = threading.Timer(self.batch_window, self._flush_batch)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+    
+    def _flush_batch(self):
+        """
+        Close the batch window and greet the best candidate.
+        
+        The highest-confidence person not yet greeted is greeted now; the
+        rest of the batch is queued as pending greetings.
+        """
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+            self._batch_timer = None
+        
+        with self._pending_lock:
+            busy = self._busy.is_set()
+            if busy:
+                # A greeting started since this window opened; queue behind it
+                dropped = [self._push_pending_locked(event) for event in batch]
+            else:
+                self._busy.set()
+        
+        if busy:
+            for event in dropped:
+                self._warn_dropped(event)
+            return
+        
+        greeted = self._greeted_frozen
+        candidates = [e for e in batch if sys.intern(e.person_name) not in greeted]
+        if not candidates:
+            self._drain_pending()
+            return
+        
+        winner = max(candidates, key=lambda e: e.confidence)
+        for event in candidates:
+            if event is not winner:
+                self._push_pending(event)
+        
+        logger.debug("Batch of %d closed, greeting %s first", len(batch), winner.person_name)
+        self._slow_execute(winner)
+    
+    def _slow_execute(self, event: RecognitionEvent):
+        """
+        Run a greeting for an event that passed the reject check.
+        
+        The caller must already hold the busy flag (_claim_or_queue or
+        _flush_batch); it is released by the final _drain_pending.
+        
+        Args:
+            event: Recognition event to respond to
+        """
         try:
             # Execute coordinated greeting (AC: 2, 3)
             self._execute_greeting(event)
         except Exception as e:
-            logger.error(f"Error executing greeting: {e}")
+            logger.error("Error executing greeting: %s", e)
         finally:
-            with self.greeting_lock:
-                self.greeting_in_progress = False
-            
-            # Process pending greetings
-            self._process_pending_greetings()
+            # Greet anyone queued meanwhile; clears the busy flag when done
+            self._drain_pending()
     
     def _execute_greeting(self, event: RecognitionEvent):
         """
@@ -197,16 +373,16 @@ class GreetingCoordinator:
         """
         start_time = time.time()
         
-        logger.info(f"Greeting {event.person_name} (confidence: {event.confidence:.2f})")
-        
-        # 1. Start gesture immediately (AC: 2, 3)
-        self.behavior_manager.execute_behavior(greeting_wave)
+        logger.info("Greeting %s (confidence: %.2f)", event.person_name, event.confidence)
         
-        # Track initial response latency (AC: 4)
-        initial_latency = (time.time() - start_time) * 1000  # ms
+        # 1. Start gesture immediately (AC: 2, 3) on the I/O pool, so a
+        #    blocking robot write cannot push back the start of speech
+        gesture_future = self._io_pool.submit(self._start_gesture)
         
-        # 2. Wait before speech (gesture starts first) (AC: 3)
-        time.sleep(self.gesture_speech_delay)
+        # 2. Wait out the rest of the delay before speech (gesture starts first) (AC: 3)
+        remaining = self.gesture_speech_delay - (time.time() - start_time)
+        if remaining > 0:
+            time.sleep(remaining)
         
         # 3. Start speech (during gesture) (AC: 3)
         if self.use_enhanced_voice and self.adaptive_tts and self.greeting_selector:
@@ -221,23 +397,45 @@ class GreetingCoordinator:
         else:
             logger.warning("No TTS system available!")
         
+        # Track initial response latency (AC: 4); waits for the gesture to
+        # be issued so greetings never overlap on the robot
+        initial_latency = (gesture_future.result() - start_time) * 1000  # ms
+        
         # 4. Mark as greeted (AC: 6)
-        self.greeted_persons.add(event.person_name)
+        self._mark_greeted(event.person_name)
         self.total_greetings += 1
         
         # 5. Track full latency (AC: 4)
         total_latency = (time.time() - start_time) * 1000  # ms
         self.latencies.append(total_latency)
-        self.avg_latency = sum(self.latencies) / len(self.latencies)
+        self._latency_sum += total_latency
+        self.avg_latency = self._latency_sum / len(self.latencies)
         self.max_latency = max(self.max_latency, total_latency)
         self.min_latency = min(self.min_latency, total_latency)
         
-        logger.info(f"  Initial response: {initial_latency:.1f}ms")
-        logger.info(f"  Total coordination: {total_latency:.1f}ms")
+        logger.info("  Initial response: %.1fms", initial_latency)
+        logger.info("  Total coordination: %.1fms", total_latency)
         
         # Check latency target (AC: 4)
-        if initial_latency > 400:
-            logger.warning(f"⚠️  Initial latency {initial_latency:.1f}ms exceeds 400ms target!")
+        if initial_latency > self.target_latency_ms:
+            self._target_misses += 1
+            logger.warning(
+                "⚠️  Initial latency %.1fms exceeds %dms target!",
+                initial_latency, self.target_latency_ms
+            )
+    
+    def _start_gesture(self) -> float:
+        """
+        Start the greeting gesture (runs on the I/O pool).
+        
+        BehaviorManager.execute_behavior serializes on its own lock, so it
+        is safe to call from a pool thread.
+        
+        Returns:
+            Time at which the gesture was issued
+        """
+        self.behavior_manager.execute_behavior(greeting_wave)
+        return time.time()
     
     def _speak_enhanced(self, person_name: Optional[str], greeting_type: GreetingType):
         """
@@ -247,13 +445,17 @@ class GreetingCoordinator:
             person_name: Person's name (or None for unknown)
             greeting_type: Type of greeting
         """
-        # Build context
-        context = GreetingContext(
-            time_of_day=self.greeting_selector.get_time_of_day(),
-            session_duration=time.time() - self.session_start,
-            is_first_greeting=(len(self.greeted_persons) == 0),
-            interaction_count=self.total_greetings
-        )
+        # Time-of-day bucket changes at most hourly; refresh it once a minute
+        now = time.time()
+        if now - self._tod_cache[0] > self.TIME_OF_DAY_TTL:
+            self._tod_cache = (now, self.greeting_selector.get_time_of_day())
+        
+        # Refresh the reused context in place (one greeting in flight at a time)
+        context = self._ctx
+        context.time_of_day = self._tod_cache[1]
+        context.session_duration = now - self.session_start
+        context.is_first_greeting = not self._greeted_frozen
+        context.interaction_count = self.total_greetings
         
         # Select varied greeting
         template = self.greeting_selector.select_greeting(
@@ -262,52 +464,164 @@ class GreetingCoordinator:
             context=context
         )
         
-        logger.info(f"  Selected: '{template.text[:50]}...' ({template.emotion})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("  Selected: '%s...' (%s)", template.text[:50], template.emotion)
         
         # Synthesize and speak with async wrapper
         result = asyncio.run(self.adaptive_tts.speak_greeting(template))
         
         if result.success:
-            cached = result.audio_data.cached if result.audio_data else False
-            logger.info(f"  🔊 Spoke with {result.backend_used.value if result.backend_used else 'unknown'} "
-                       f"({'cached' if cached else 'generated'})")
+            if logger.isEnabledFor(logging.INFO):
+                cached = result.audio_data.cached if result.audio_data else False
+                logger.info(
+                    "  🔊 Spoke with %s (%s)",
+                    result.backend_used.value if result.backend_used else 'unknown',
+                    'cached' if cached else 'generated'
+                )
         else:
-            logger.error(f"  ✗ Speech failed: {result.error}")
+            logger.error("  ✗ Speech failed: %s", result.error)
+    
+    def _push_pending(self, event: RecognitionEvent):
+        """
+        Queue an event behind the in-flight greeting.
+        
+        Args:
+            event: Recognition event to greet later
+        """
+        with self._pending_lock:
+            dropped = self._push_pending_locked(event)
+        self._warn_dropped(dropped)
+    
+    def _push_pending_locked(self, event: RecognitionEvent) -> Optional[RecognitionEvent]:
+        """
+        Push an event onto the pending heap; caller holds _pending_lock.
+        
+        The queue is bounded; when full, the lowest-confidence entry
+        (possibly the new one) is dropped so recognition storms cannot
+        grow it without limit.
+        
+        Args:
+            event: Recognition event to greet later
+            
+        Returns:
+            The dropped event, or None if nothing was dropped
+        """
+        self._pending_seq += 1
+        entry = (-event.confidence, self._pending_seq, event)
+        heap = self._pending_heap
+        if len(heap) < self.MAX_PENDING_GREETINGS:
+            heapq.heappush(heap, entry)
+            return None
+        
+        worst = max(heap)
+        if entry < worst:
+            heap[heap.index(worst)] = entry
+            heapq.heapify(heap)
+            return worst[2]
+        return event
+    
+    def _warn_dropped(self, dropped: Optional[RecognitionEvent]):
+        """Log an event dropped from the full pending queue (outside the lock)."""
+        if dropped is not None:
+            logger.warning(
+                "Pending greeting queue full (%d), dropping %s",
+                self.MAX_PENDING_GREETINGS, dropped.person_name
+            )
     
-    def _process_pending_greetings(self):
+    def _queue_if_busy(self, event: RecognitionEvent) -> bool:
+        """
+        Queue an event if a greeting is in flight.
+        
+        The busy check and the push happen in one _pending_lock section,
+        the same lock _drain_pending holds when it finds the queue empty and
+        clears the flag, so an event is never queued after the final drain.
+        
+        Args:
+            event: Recognition event
+            
+        Returns:
+            True if the event was queued
+        """
+        with self._pending_lock:
+            if not self._busy.is_set():
+                return False
+            dropped = self._push_pending_locked(event)
+        self._warn_dropped(dropped)
+        return True
+    
+    def _claim_or_queue(self, event: RecognitionEvent) -> bool:
+        """
+        Atomically claim the greeting slot, or queue the event behind it.
+        
+        Args:
+            event: Recognition event
+            
+        Returns:
+            True if the caller now holds the busy flag and must greet (and
+            then drain); False if the event was queued instead
+        """
+        with self._pending_lock:
+            if not self._busy.is_set():
+                self._busy.set()
+                return True
+            dropped = self._push_pending_locked(event)
+        self._warn_dropped(dropped)
+        return False
+    
+    def _drain_pending(self):
         """
         Process queued greetings (multi-person handling).
         
-        Sorts by confidence and greets highest confidence person
-        that hasn't been greeted yet (AC: 5).
+        Pops the highest confidence person not yet greeted and greets them,
+        one at a time, until the queue is empty (AC: 5). The pending lock is
+        only held while popping, never across a greeting. Clears the busy
+        flag in the same locked section that finds the queue empty; since
+        _queue_if_busy checks the flag and pushes under that lock too, an
+        event is either seen here or finds the flag already cleared.
         """
-        if not self.pending_greetings:
-            return
+        while True:
+            with self._pending_lock:
+                if not self._pending_heap:
+                    self._busy.clear()
+                    return
+                _, _, event = heapq.heappop(self._pending_heap)
+            
+            if sys.intern(event.person_name) in self._greeted_frozen:
+                continue
+            
+            logger.debug("Processing pending greeting for %s", event.person_name)
+            try:
+                self._execute_greeting(event)
+            except Exception as e:
+                logger.error("Error in pending greeting: %s", e)
+    
+    @property
+    def greeting_in_progress(self) -> bool:
+        """Whether a greeting is currently executing."""
+        return self._busy.is_set()
+    
+    @property
+    def pending_greetings(self) -> List[RecognitionEvent]:
+        """Queued greetings, highest confidence first (AC: 5)."""
+        with self._pending_lock:
+            return [event for _, _, event in sorted(self._pending_heap)]
+    
+    @property
+    def greeted_persons(self) -> frozenset:
+        """Snapshot of person names greeted this session."""
+        return self._greeted_frozen
+    
+    def _mark_greeted(self, person_name: str):
+        """
+        Record a person as greeted this session.
+        
+        Swaps in a new frozenset rather than mutating in place so that
+        concurrent readers always see a consistent snapshot.
         
-        # Sort by confidence (highest first) (AC: 5)
-        self.pending_greetings.sort(key=lambda e: e.confidence, reverse=True)
-        
-        # Greet highest confidence person not yet greeted
-        for event in self.pending_greetings:
-            if event.person_name not in self.greeted_persons:
-                logger.debug(f"Processing pending greeting for {event.person_name}")
-                self.pending_greetings.remove(event)
-                
-                # Execute with lock
-                with self.greeting_lock:
-                    self.greeting_in_progress = True
-                
-                try:
-                    self._execute_greeting(event)
-                except Exception as e:
-                    logger.error(f"Error in pending greeting: {e}")
-                finally:
-                    with self.greeting_lock:
-                        self.greeting_in_progress = False
-                
-                # Recursively process remaining (one at a time)
-                self._process_pending_greetings()
-                break
+        Args:
+            person_name: Person's name
+        """
+        self._greeted_frozen = self._greeted_frozen | {sys.intern(person_name)}
     
     def reset_session(self):
         """
@@ -316,11 +630,26 @@ class GreetingCoordinator:
         Call this when starting a new interaction session
         (e.g., after a break, or explicit user reset).
         """
-        num_greeted = len(self.greeted_persons)
-        self.greeted_persons.clear()
-        self.pending_greetings.clear()
+        num_greeted = len(self._greeted_frozen)
+        self._greeted_frozen = frozenset()
+        with self._batch_lock:
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+            self._batch.clear()
+        with self._pending_lock:
+            self._pending_heap.clear()
         logger.info(f"Greeting session reset ({num_greeted} persons cleared)")
     
+    def shutdown(self):
+        """Cancel any open batch window and stop the I/O pool."""
+        with self._batch_lock:
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+        self._io_pool.shutdown(wait=False)
+        logger.info("GreetingCoordinator shut down")
+    
     def has_greeted(self, person_name: str) -> bool:
         """
         Check if person has been greeted this session.
@@ -331,7 +660,7 @@ class GreetingCoordinator:
         Returns:
             True if person has been greeted, False otherwise
         """
-        return person_name in self.greeted_persons
+        return sys.intern(person_name) in self._greeted_frozen
     
     def get_stats(self) -> Dict:
         """
@@ -340,39 +669,26 @@ class GreetingCoordinator:
         Returns:
             Dictionary with performance metrics
         """
+        greeted = self.total_greetings > 0
         return {
             "total_greetings": self.total_greetings,
-            "unique_people_greeted": len(self.greeted_persons),
+            "unique_people_greeted": len(self._greeted_frozen),
             "greeting_in_progress": self.greeting_in_progress,
-            "pending_greetings": len(self.pending_greetings),
-            "avg_latency_ms": round(self.avg_latency, 2) if self.latencies else 0.0,
-            "min_latency_ms": round(self.min_latency, 2) if self.latencies else 0.0,
-            "max_latency_ms": round(self.max_latency, 2) if self.latencies else 0.0,
-            "latency_target_met": all(l < 400 for l in self.latencies) if self.latencies else True
+            "pending_greetings": len(self._pending_heap),
+            "avg_latency_ms": round(self.avg_latency, 2) if greeted else 0.0,
+            "min_latency_ms": round(self.min_latency, 2) if greeted else 0.0,
+            "max_latency_ms": round(self.max_latency, 2) if greeted else 0.0,
+            "latency_target_met": self._target_misses == 0
         }
     
     def get_detailed_stats(self) -> str:
         """Get formatted statistics string."""
         stats = self.get_stats()
-        
-        lines = [
-            "=" * 60,
-            "Greeting Coordinator Statistics",
-            "=" * 60,
-            f"Total greetings: {stats['total_greetings']}",
-            f"Unique people greeted: {stats['unique_people_greeted']}",
-            f"Greeting in progress: {stats['greeting_in_progress']}",
-            f"Pending greetings: {stats['pending_greetings']}",
-            "",
-            "Latency Performance:",
-            f"  Average: {stats['avg_latency_ms']:.1f}ms",
-            f"  Minimum: {stats['min_latency_ms']:.1f}ms",
-            f"  Maximum: {stats['max_latency_ms']:.1f}ms",
-            f"  Target (<400ms): {'✅ MET' if stats['latency_target_met'] else '❌ MISSED'}",
-            "=" * 60
-        ]
-        
-        return "\n".join(lines)
+        return _STATS_TEMPLATE.format(
+            target_latency_ms=self.target_latency_ms,
+            latency_target='✅ MET' if stats['latency_target_met'] else '❌ MISSED',
+            **stats
+        )
 
 
 # =============================================================================
@@ -381,6 +697,8 @@ class GreetingCoordinator:
 
 def main():
     """Demo greeting coordination."""
+    logging.basicConfig(level=logging.INFO)
+    
     print("=" * 70)
     print("Greeting Coordinator Demo")
     print("=" * 70)
@@ -506,6 +824,7 @@ def main():
     print()
     
     # Cleanup
+    coordinator.shutdown()
     tts_mgr.shutdown()
 
 
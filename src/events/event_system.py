@@ -11,13 +11,17 @@ This module tracks people across frames and emits events for:
 - No faces (no faces detected)
 """
 
+import sys
 import time
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Callable, Any
 from collections import deque
+from itertools import islice
 import logging
 
+import numpy as np
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -31,18 +35,31 @@ except ImportError:
 
 
 class EventType(Enum):
-    """Recognition event types."""
+    """
+    Recognition event types.
+    
+    Each member also carries a stable integer ``index`` (0..3, definition
+    order) for list-indexed per-type tables.
+    """
     PERSON_RECOGNIZED = "person_recognized"  # Known person detected
     PERSON_UNKNOWN = "person_unknown"        # Unknown person detected
     PERSON_DEPARTED = "person_departed"      # Person left frame
     NO_FACES = "no_faces"                    # No faces in frame
+    
+    def __init__(self, value: str) -> None:
+        # Members are created in definition order, so the count so far is
+        # this member's position
+        self.index = len(type(self).__members__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RecognitionEvent:
     """
     Recognition event with all relevant information.
     
+    Slotted so EventManager can recycle instances evicted from its
+    history instead of allocating one per event.
+    
     Attributes:
         event_type: Type of event
         timestamp: Unix timestamp when event occurred
@@ -58,20 +75,27 @@ class RecognitionEvent:
     bbox: Optional[Tuple[int, int, int, int]]
     frame_number: int
     
+    def __post_init__(self) -> None:
+        """Intern the person name so downstream set/dict lookups hit the identity fast path."""
+        self.person_name = sys.intern(self.person_name)
+    
     def __str__(self) -> str:
         """String representation for logging."""
-        if self.event_type == EventType.NO_FACES:
+        if self.event_type is EventType.NO_FACES:
             return f"[Frame {self.frame_number}] NO_FACES"
-        elif self.event_type == EventType.PERSON_DEPARTED:
+        elif self.event_type is EventType.PERSON_DEPARTED:
             return f"[Frame {self.frame_number}] DEPARTED: {self.person_name}"
         else:
             return f"[Frame {self.frame_number}] {self.event_type.value.upper()}: {self.person_name} ({self.confidence:.2f})"
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonState:
     """
-    Tracks a person's state across frames.
+    Snapshot of a tracked person's state across frames.
+    
+    EventManager keeps tracking state in parallel arrays; this view is
+    built on demand by EventManager.current_state.
     
     Attributes:
         name: Person's name
@@ -80,6 +104,7 @@ class PersonState:
         last_confidence: Most recent confidence score
         last_bbox: Most recent bounding box
         event_triggered: Whether PERSON_RECOGNIZED/UNKNOWN event has been triggered
+        event_type: Event fired once debounced (PERSON_UNKNOWN for "unknown")
     """
     name: str
     consecutive_frames: int = 0
@@ -87,6 +112,7 @@ class PersonState:
     last_confidence: float = 0.0
     last_bbox: Optional[Tuple[int, int, int, int]] = None
     event_triggered: bool = False
+    event_type: Optional[EventType] = None
 
 
 class EventManager:
@@ -102,10 +128,20 @@ class EventManager:
         max_history: Maximum number of events to keep in history
         event_history: Deque of recent events
         callbacks: Dict mapping event types to callback functions
-        current_state: Dict mapping person names to PersonState
+        current_state: Dict mapping person names to PersonState (snapshot)
         frame_count: Total frames processed
+    
+    Per-person tracking state is stored as a struct of arrays (one NumPy
+    array per field, one slot per tracked person) so the per-frame
+    departed/consecutive bookkeeping is vectorized over all tracked people.
     """
     
+    # Initial number of tracking slots (doubles on overflow)
+    INITIAL_CAPACITY = 8
+    
+    # Minimum seconds between accuracy_update log records
+    ACCURACY_LOG_INTERVAL = 5.0
+    
     def __init__(
         self,
         debounce_seconds: Optional[float] = None,
@@ -159,10 +195,16 @@ class EventManager:
         self.max_history = max_history
         
         self.event_history: deque = deque(maxlen=max_history)
-        self.callbacks: Dict[EventType, List[Tuple[int, Callable]]] = {
-            event_type: [] for event_type in EventType
-        }
-        self.current_state: Dict[str, PersonState] = {}
+        self._event_pool: List[RecognitionEvent] = []
+        # Callbacks per event type as parallel tuples (functions, ids) in
+        # lists indexed by EventType.index, rebuilt on add/remove so
+        # dispatch is a list index plus a plain loop over functions
+        self._callback_fns: List[Tuple[Callable, ...]] = [()] * len(EventType)
+        self._callback_ids: List[Tuple[int, ...]] = [()] * len(EventType)
+        self._init_tracking()
+        self._event_counts = [0] * len(EventType)
+        self._last_accuracy_log = 0.0
+        self._in_no_faces_state = False
         self.frame_count = 0
         self.next_callback_id = 0
         
@@ -204,125 +246,291 @@ class EventManager:
             self.frame_count += 1
             frame_number = self.frame_count
         
-        events = []
-        current_names = set()
+        # One timestamp per frame so all events from it agree
+        now = time.time()
+        callback_fns = self._callback_fns
+        events: List[RecognitionEvent] = []
+        n = len(self._names)
+        seen_idx: List[int] = []
         
         # Process detected people
         for name, confidence, bbox in results:
-            current_names.add(name)
+            # Names recur for thousands of frames; interning makes the
+            # tracking dict lookups hit the identity fast path
+            name = sys.intern(name)
+            idx = self._name_to_idx.get(name)
             
-            if name in self.current_state:
-                # Person already being tracked
-                state = self.current_state[name]
-                state.consecutive_frames += 1
-                state.departed_frames = 0  # Reset departed counter
-                state.last_confidence = confidence
-                state.last_bbox = bbox
-                
-                # Trigger event after debounce period
-                if state.consecutive_frames == self.debounce_frames and not state.event_triggered:
-                    if name == "unknown":
-                        event_type = EventType.PERSON_UNKNOWN
-                    else:
-                        event_type = EventType.PERSON_RECOGNIZED
-                    
-                    event = RecognitionEvent(
-                        event_type=event_type,
-                        timestamp=time.time(),
-                        person_name=name,
-                        confidence=confidence,
-                        bbox=bbox,
-                        frame_number=frame_number
-                    )
-                    events.append(event)
-                    state.event_triggered = True
-                    self._add_to_history(event)
-                    self._trigger_callbacks(event)
-                    
-                    # Track accuracy metrics (Story 4.2)
-                    self._update_accuracy_metrics(event_type, name, confidence)
-                    
-                    logger.info(f"✓ Event: {event}")
+            if idx is None:
+                # New person detected; this sighting is the first of the
+                # debounce count (consecutive starts at 1)
+                seen_idx.append(self._add_slot(name, confidence, bbox))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Started tracking: %s", name)
+                continue
             
-            else:
-                # New person detected
-                self.current_state[name] = PersonState(
-                    name=name,
-                    consecutive_frames=1,
-                    last_confidence=confidence,
-                    last_bbox=bbox
-                )
-                logger.debug(f"Started tracking: {name}")
-        
-        # Check for departed people
-        departed_names = []
-        for name, state in self.current_state.items():
-            if name not in current_names:
-                # Person not detected in this frame
-                state.departed_frames += 1
-                state.consecutive_frames = 0  # Reset consecutive counter
+            # Person already being tracked (or seen twice in this frame)
+            seen_idx.append(idx)
+            self._consecutive[idx] += 1
+            self._departed[idx] = 0  # Reset departed counter
+            self._confidence[idx] = confidence
+            self._bbox[idx] = bbox
+        
+        # Nobody tracked: nothing to debounce or depart, so idle frames
+        # skip the array bookkeeping entirely
+        m = len(self._names)
+        if m:
+            seen = np.zeros(m, dtype=bool)
+            seen[seen_idx] = True
+            consecutive = self._consecutive[:m]
+            triggered = self._triggered[:m]
+            
+            # People tracked before this frame but not detected in it
+            unseen = ~seen[:n]
+            departed = self._departed[:n]
+            departed[unseen] += 1
+            consecutive[:n][unseen] = 0  # Reset consecutive counter
+            
+            # Trigger event after debounce period
+            fired = np.flatnonzero(seen & (consecutive >= self.debounce_frames) & ~triggered)
+            for idx in fired:
+                name = self._names[idx]
+                event_type = self._event_types[idx]
                 
-                # Trigger PERSON_DEPARTED after departed threshold
-                if state.departed_frames == self.departed_frames and state.event_triggered:
-                    event = RecognitionEvent(
-                        event_type=EventType.PERSON_DEPARTED,
-                        timestamp=time.time(),
-                        person_name=name,
-                        confidence=0.0,
-                        bbox=None,
-                        frame_number=frame_number
-                    )
-                    events.append(event)
-                    self._add_to_history(event)
+                confidence = float(self._confidence[idx])
+                event = self._acquire_event(
+                    event_type=event_type,
+                    timestamp=now,
+                    person_name=name,
+                    confidence=confidence,
+                    bbox=tuple(self._bbox[idx].tolist()),
+                    frame_number=frame_number
+                )
+                events.append(event)
+                triggered[idx] = True
+                self._add_to_history(event)
+                if callback_fns[event_type.index]:
                     self._trigger_callbacks(event)
-                    departed_names.append(name)
-                    
-                    logger.info(f"✓ Event: {event}")
-        
-        # Remove departed people from tracking
-        for name in departed_names:
-            del self.current_state[name]
-            logger.debug(f"Stopped tracking: {name}")
-        
-        # Check for NO_FACES event
-        if len(results) == 0 and len(self.current_state) == 0:
-            # Only trigger NO_FACES once per "session"
-            # (not every frame when no faces present)
-            if self.frame_count == 1 or self._last_event_was_not_no_faces():
-                event = RecognitionEvent(
-                    event_type=EventType.NO_FACES,
-                    timestamp=time.time(),
-                    person_name="",
+                
+                logger.info("✓ Event: %s", event)
+            
+            if len(fired):
+                # Accuracy metrics are tallied in _add_to_history (Story 4.2)
+                self._log_accuracy_metrics(now)
+            
+            # Trigger PERSON_DEPARTED after departed threshold
+            departed_idx = np.flatnonzero(unseen & (departed == self.departed_frames) & triggered[:n])
+            for idx in departed_idx:
+                event = self._acquire_event(
+                    event_type=EventType.PERSON_DEPARTED,
+                    timestamp=now,
+                    person_name=self._names[idx],
                     confidence=0.0,
                     bbox=None,
                     frame_number=frame_number
                 )
                 events.append(event)
                 self._add_to_history(event)
-                self._trigger_callbacks(event)
+                if callback_fns[EventType.PERSON_DEPARTED.index]:
+                    self._trigger_callbacks(event)
                 
-                logger.debug(f"Event: {event}")
+                logger.info("✓ Event: %s", event)
+            
+            # Remove departed people from tracking (highest slot first so
+            # swap-with-last never moves a slot still waiting for removal)
+            for idx in departed_idx[::-1]:
+                name = self._names[idx]
+                self._remove_slot(int(idx))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Stopped tracking: %s", name)
+        
+        # NO_FACES fires once when the scene becomes empty, then stays
+        # suppressed by a flag until someone is tracked again
+        empty = not results and not self._names
+        if empty and not self._in_no_faces_state:
+            event = self._acquire_event(
+                event_type=EventType.NO_FACES,
+                timestamp=now,
+                person_name="",
+                confidence=0.0,
+                bbox=None,
+                frame_number=frame_number
+            )
+            events.append(event)
+            self._add_to_history(event)
+            if callback_fns[EventType.NO_FACES.index]:
+                self._trigger_callbacks(event)
+            self._in_no_faces_state = True
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Event: %s", event)
+        elif not empty:
+            self._in_no_faces_state = False
         
         return events
     
-    def _last_event_was_not_no_faces(self) -> bool:
-        """Check if last event was something other than NO_FACES."""
-        if len(self.event_history) == 0:
-            return True
-        return self.event_history[-1].event_type != EventType.NO_FACES
+    def _init_tracking(self, capacity: Optional[int] = None) -> None:
+        """Allocate empty per-person tracking arrays."""
+        capacity = capacity or self.INITIAL_CAPACITY
+        self._names: List[str] = []
+        self._event_types: List[EventType] = []
+        self._name_to_idx: Dict[str, int] = {}
+        self._consecutive = np.zeros(capacity, dtype=np.int32)
+        self._departed = np.zeros(capacity, dtype=np.int32)
+        self._confidence = np.zeros(capacity, dtype=np.float64)
+        self._bbox = np.zeros((capacity, 4), dtype=np.int32)
+        self._triggered = np.zeros(capacity, dtype=bool)
+    
+    def _grow_tracking(self) -> None:
+        """Double the capacity of the tracking arrays."""
+        n = len(self._names)
+        capacity = 2 * len(self._consecutive)
+        for attr in ("_consecutive", "_departed", "_confidence", "_bbox", "_triggered"):
+            old = getattr(self, attr)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, attr, new)
+    
+    def _add_slot(
+        self,
+        name: str,
+        confidence: float,
+        bbox: Tuple[int, int, int, int]
+    ) -> int:
+        """Start tracking a person in the next free slot."""
+        idx = len(self._names)
+        if idx == len(self._consecutive):
+            self._grow_tracking()
+        
+        self._names.append(name)
+        self._event_types.append(
+            EventType.PERSON_UNKNOWN if name == "unknown" else EventType.PERSON_RECOGNIZED
+        )
+        self._name_to_idx[name] = idx
+        self._consecutive[idx] = 1
+        self._departed[idx] = 0
+        self._confidence[idx] = confidence
+        self._bbox[idx] = bbox
+        self._triggered[idx] = False
+        return idx
     
-    def _add_to_history(self, event: RecognitionEvent):
-        """Add event to history (FIFO with max size)."""
-        self.event_history.append(event)
+    def _remove_slot(self, idx: int) -> None:
+        """Stop tracking the person in slot idx (swap-with-last)."""
+        last = len(self._names) - 1
+        del self._name_to_idx[self._names[idx]]
+        
+        if idx != last:
+            moved = self._names[last]
+            self._names[idx] = moved
+            self._event_types[idx] = self._event_types[last]
+            self._name_to_idx[moved] = idx
+            for arr in (self._consecutive, self._departed, self._confidence, self._bbox, self._triggered):
+                arr[idx] = arr[last]
+        
+        self._names.pop()
+        self._event_types.pop()
+    
+    @property
+    def current_state(self) -> Dict[str, PersonState]:
+        """Snapshot of tracked people, keyed by name."""
+        return {
+            name: PersonState(
+                name=name,
+                consecutive_frames=int(self._consecutive[idx]),
+                departed_frames=int(self._departed[idx]),
+                last_confidence=float(self._confidence[idx]),
+                last_bbox=tuple(self._bbox[idx].tolist()),
+                event_triggered=bool(self._triggered[idx]),
+                event_type=self._event_types[idx]
+            )
+            for idx, name in enumerate(self._names)
+        }
     
-    def _trigger_callbacks(self, event: RecognitionEvent):
+    def _acquire_event(
+        self,
+        event_type: EventType,
+        timestamp: float,
+        person_name: str,
+        confidence: float,
+        bbox: Optional[Tuple[int, int, int, int]],
+        frame_number: int
+    ) -> RecognitionEvent:
+        """Reuse a pooled event if one is free, else allocate a new one."""
+        if not self._event_pool:
+            return RecognitionEvent(
+                event_type=event_type,
+                timestamp=timestamp,
+                person_name=person_name,
+                confidence=confidence,
+                bbox=bbox,
+                frame_number=frame_number
+            )
+        event = self._event_pool.pop()
+        event.event_type = event_type
+        event.timestamp = timestamp
+        event.person_name = sys.intern(person_name)
+        event.confidence = confidence
+        event.bbox = bbox
+        event.frame_number = frame_number
+        return event
+    
+    def _add_to_history(self, event: RecognitionEvent) -> None:
+        """
+        Add event to history (FIFO with max size), recycling the evicted event.
+        
+        This is the single place per-type event counts (for the history
+        window) and the cumulative accuracy metrics (Story 4.2) are updated.
+        """
+        event_type = event.event_type
+        metrics = self.accuracy_metrics
+        if event_type is EventType.PERSON_RECOGNIZED:
+            # Assume true positive (correctly recognized known person)
+            # Note: False positive detection would require ground truth data
+            metrics['total_events'] += 1
+            metrics['recognized_count'] += 1
+            metrics['true_positives'] += 1
+        elif event_type is EventType.PERSON_UNKNOWN:
+            # Assume true negative (correctly identified as unknown)
+            # Note: False negative detection would require ground truth data
+            metrics['total_events'] += 1
+            metrics['unknown_count'] += 1
+            metrics['true_negatives'] += 1
+        
+        history = self.event_history
+        if len(history) < self.max_history:
+            history.append(event)
+            self._event_counts[event_type.index] += 1
+            return
+        if not self.max_history:
+            return
+        
+        evicted = history[0]
+        history.append(event)
+        self._event_counts[event_type.index] += 1
+        self._event_counts[evicted.event_type.index] -= 1
+        # Only recycle if nothing outside the history still holds the event
+        # (the two references are this local and getrefcount's argument)
+        if sys.getrefcount(evicted) == 2 and len(self._event_pool) < self.max_history:
+            self._event_pool.append(evicted)
+    
+    def _trigger_callbacks(self, event: RecognitionEvent) -> None:
         """Trigger all callbacks registered for this event type."""
-        for callback_id, callback_fn in self.callbacks[event.event_type]:
+        i = event.event_type.index
+        fns = self._callback_fns[i]
+        for callback_fn in fns:
             try:
                 callback_fn(event)
             except Exception as e:
+                callback_id = self._callback_ids[i][fns.index(callback_fn)]
                 logger.error(f"Callback {callback_id} failed: {e}")
     
+    @property
+    def callbacks(self) -> Dict[EventType, List[Tuple[int, Callable]]]:
+        """Registered callbacks as (callback_id, callback_fn) pairs per event type."""
+        return {
+            event_type: list(zip(self._callback_ids[event_type.index], self._callback_fns[event_type.index]))
+            for event_type in EventType
+        }
+    
     def add_callback(
         self,
         event_type: EventType,
@@ -349,8 +557,11 @@ class EventManager:
         callback_id = self.next_callback_id
         self.next_callback_id += 1
         
-        self.callbacks[event_type].append((callback_id, callback_fn))
-        logger.debug(f"Added callback {callback_id} for {event_type.value}")
+        i = event_type.index
+        self._callback_fns[i] = self._callback_fns[i] + (callback_fn,)
+        self._callback_ids[i] = self._callback_ids[i] + (callback_id,)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added callback %d for %s", callback_id, event_type.value)
         
         return callback_id
     
@@ -364,12 +575,15 @@ class EventManager:
         Returns:
             True if callback was found and removed
         """
-        for event_type, callbacks in self.callbacks.items():
-            for i, (cid, _) in enumerate(callbacks):
-                if cid == callback_id:
-                    callbacks.pop(i)
-                    logger.debug(f"Removed callback {callback_id}")
-                    return True
+        for t, ids in enumerate(self._callback_ids):
+            if callback_id in ids:
+                i = ids.index(callback_id)
+                fns = self._callback_fns[t]
+                self._callback_fns[t] = fns[:i] + fns[i + 1:]
+                self._callback_ids[t] = ids[:i] + ids[i + 1:]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Removed callback %d", callback_id)
+                return True
         return False
     
     def get_recent_events(self, count: Optional[int] = None) -> List[RecognitionEvent]:
@@ -382,68 +596,50 @@ class EventManager:
         Returns:
             List of recent events (newest first)
         """
-        events = list(self.event_history)
-        events.reverse()  # Newest first
+        newest_first = reversed(self.event_history)
         
-        if count is not None:
-            events = events[:count]
+        if count is None:
+            return list(newest_first)
         
-        return events
+        return list(islice(newest_first, count))
     
     def get_stats(self) -> Dict[str, Any]:
         """Get event manager statistics."""
-        event_counts = {event_type.value: 0 for event_type in EventType}
-        for event in self.event_history:
-            event_counts[event.event_type.value] += 1
+        counts = self._event_counts
+        event_counts = {event_type.value: counts[event_type.index] for event_type in EventType}
         
         return {
             "frame_count": self.frame_count,
             "event_history_size": len(self.event_history),
-            "currently_tracked": len(self.current_state),
-            "tracked_people": list(self.current_state.keys()),
+            "currently_tracked": len(self._names),
+            "tracked_people": list(self._names),
             "event_counts": event_counts,
             "callback_counts": {
-                event_type.value: len(callbacks)
-                for event_type, callbacks in self.callbacks.items()
+                event_type.value: len(self._callback_fns[event_type.index])
+                for event_type in EventType
             }
         }
     
-    def _update_accuracy_metrics(self, event_type: EventType, person_name: str, confidence: float):
+    def _log_accuracy_metrics(self, now: float) -> None:
         """
-        Update accuracy tracking metrics (Story 4.2).
+        Log the cumulative accuracy metrics, at most once per
+        ACCURACY_LOG_INTERVAL seconds (Story 4.2).
         
         Args:
-            event_type: Type of event triggered
-            person_name: Person's name
-            confidence: Recognition confidence score
+            now: Timestamp of the current frame
         """
-        self.accuracy_metrics['total_events'] += 1
+        if now - self._last_accuracy_log < self.ACCURACY_LOG_INTERVAL:
+            return
+        self._last_accuracy_log = now
         
-        if event_type == EventType.PERSON_RECOGNIZED:
-            # Assume true positive (correctly recognized known person)
-            # Note: False positive detection would require ground truth data
-            self.accuracy_metrics['recognized_count'] += 1
-            self.accuracy_metrics['true_positives'] += 1
-            
-        elif event_type == EventType.PERSON_UNKNOWN:
-            # Assume true negative (correctly identified as unknown)
-            # Note: False negative detection would require ground truth data
-            self.accuracy_metrics['unknown_count'] += 1
-            self.accuracy_metrics['true_negatives'] += 1
-        
-        # Log accuracy event
-        logger.info(
-            f"Recognition accuracy tracked",
-            extra={
-                'event': 'accuracy_update',
-                'data': {
-                    'event_type': event_type.value,
-                    'person_name': person_name,
-                    'confidence': confidence
-                },
-                'metrics': self.accuracy_metrics.copy()
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Recognition accuracy tracked",
+                extra={
+                    'event': 'accuracy_update',
+                    'metrics': dict(self.accuracy_metrics)
+                }
+            )
     
     def get_accuracy_report(self) -> Dict[str, Any]:
         """
@@ -483,10 +679,13 @@ class EventManager:
             'note': 'Accuracy assumes all recognitions are correct (no ground truth validation)'
         }
     
-    def reset(self):
+    def reset(self) -> None:
         """Reset event manager state (clear history and tracking)."""
         self.event_history.clear()
-        self.current_state.clear()
+        self._init_tracking()
+        self._event_counts = [0] * len(EventType)
+        self._last_accuracy_log = 0.0
+        self._in_no_faces_state = False
         self.frame_count = 0
         self.accuracy_metrics = {
             'true_positives': 0,
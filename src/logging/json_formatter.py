@@ -7,10 +7,39 @@ and analysis.
 
 import json
 import logging
+import time
 import traceback
-from datetime import datetime
 from typing import Any, Dict, Optional
 
+# Optional fast JSON encoder (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(log_data: Dict[str, Any]) -> str:
+        """Serialize log data to a JSON string using orjson."""
+        return orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS).decode()
+else:
+    def _dumps(log_data: Dict[str, Any]) -> str:
+        """Serialize log data to a JSON string using the standard library."""
+        return json.dumps(log_data, default=str)
+
+
+def _fast_ts(created: float) -> str:
+    """Format an epoch timestamp (LogRecord.created) as ISO 8601 UTC with milliseconds."""
+    t = time.gmtime(created)
+    ms = int((created - int(created)) * 1000)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{ms:03d}Z"
+    )
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -53,9 +82,21 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON string representation of log record
         """
+        return _dumps(self._build_log_data(record))
+    
+    def _build_log_data(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """
+        Build the dictionary that format() serializes.
+        
+        Args:
+            record: LogRecord to format
+            
+        Returns:
+            Log data dictionary (not yet JSON encoded)
+        """
         # Base log data
         log_data: Dict[str, Any] = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _fast_ts(record.created),
             'level': record.levelname,
             'module': record.module,
             'message': record.getMessage(),
@@ -66,17 +107,21 @@ class JSONFormatter(logging.Formatter):
             log_data['function'] = record.funcName
             log_data['line'] = record.lineno
         
+        # Optional fields arrive via logger.*(..., extra={...}) and so live
+        # in the record's instance dict
+        rd = record.__dict__
+        
         # Add optional event type
-        if hasattr(record, 'event'):
-            log_data['event'] = record.event
+        if 'event' in rd:
+            log_data['event'] = rd['event']
         
         # Add optional structured data
-        if hasattr(record, 'data'):
-            log_data['data'] = record.data
+        if 'data' in rd:
+            log_data['data'] = rd['data']
         
         # Add optional metrics
-        if hasattr(record, 'metrics'):
-            log_data['metrics'] = record.metrics
+        if 'metrics' in rd:
+            log_data['metrics'] = rd['metrics']
         
         # Add exception info if present
         if record.exc_info:
@@ -90,7 +135,7 @@ class JSONFormatter(logging.Formatter):
         if record.stack_info:
             log_data['stack'] = record.stack_info
         
-        return json.dumps(log_data, default=str)
+        return log_data
     
     def formatException(self, exc_info) -> str:
         """
@@ -114,8 +159,7 @@ class CompactJSONFormatter(JSONFormatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format record and remove empty fields."""
-        json_str = super().format(record)
-        log_data = json.loads(json_str)
+        log_data = self._build_log_data(record)
         
         # Remove null or empty values
         compact_data = {
@@ -123,4 +167,4 @@ class CompactJSONFormatter(JSONFormatter):
             if v is not None and v != {} and v != []
         }
         
-        return json.dumps(compact_data, default=str)
+        return _dumps(compact_data)
@@ -6,19 +6,63 @@ Configures logging system based on config.yaml settings with support for:
 - Rotating file logs
 - JSON or text format
 - Multiple log levels
+- Background handler thread (callers only enqueue records)
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 from typing import Optional
 
 from .json_formatter import JSONFormatter, CompactJSONFormatter
 
+# Import config (optional - falls back to defaults if not available)
+try:
+    from ..config import get_config
+    _CONFIG_AVAILABLE = True
+except ImportError:
+    _CONFIG_AVAILABLE = False
+
 # Module-level logger cache
 _loggers = {}
 _logging_configured = False
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener thread in the same process.
+    
+    The stock prepare() formats the record on the caller's thread and strips
+    exc_info so records can be pickled. Here the record only crosses threads,
+    so it just merges args into the message and keeps exc_info for the real
+    formatters (JSONFormatter reports the exception type separately).
+    
+    Dict-valued "data" and "metrics" extras are copied too, since callers may
+    keep mutating them while the record waits in the queue.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        for key in ('data', 'metrics'):
+            value = record.__dict__.get(key)
+            if isinstance(value, dict):
+                record.__dict__[key] = dict(value)
+        return record
+
+
+# Level names accepted by log_event(), resolved once instead of per call
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
 
 def setup_logging(
     logger_name: str = 'reachy_recognizer',
@@ -49,9 +93,8 @@ def setup_logging(
         return _loggers[logger_name]
     
     # Load config if not provided
-    if config is None:
+    if config is None and _CONFIG_AVAILABLE:
         try:
-            from ..config import get_config
             config = get_config()
         except Exception as e:
             print(f"Warning: Could not load config, using defaults: {e}")
@@ -69,6 +112,10 @@ def setup_logging(
     
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    _stop_listener(logger)
+    handlers = []
+    file_error = None
+    log_path = None
     
     # Console handler (human-readable format)
     console_handler = logging.StreamHandler()
@@ -80,7 +127,7 @@ def setup_logging(
         console_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
     console_handler.setFormatter(logging.Formatter(console_format))
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler (JSON format for analysis)
     if config and hasattr(config, 'logging') and config.logging.file_path:
@@ -105,27 +152,53 @@ def setup_logging(
             else:
                 file_handler.setFormatter(logging.Formatter(console_format))
             
-            logger.addHandler(file_handler)
-            
-            logger.info(f"Logging to file: {log_path}")
+            handlers.append(file_handler)
             
         except Exception as e:
-            logger.warning(f"Failed to setup file logging: {e}")
+            file_error = e
+            log_path = None
+    
+    # Real handlers run on a listener thread; callers only enqueue records,
+    # so formatting and file I/O never block the recognition loop
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on shutdown
+    logger._qlistener = listener
+    logger.addHandler(_InProcessQueueHandler(log_queue))
     
     # Prevent propagation to root logger
     logger.propagate = False
     
+    if log_path is not None:
+        logger.info(f"Logging to file: {log_path}")
+    elif file_error is not None:
+        logger.warning(f"Failed to setup file logging: {file_error}")
+    
     _loggers[logger_name] = logger
     _logging_configured = True
     
     return logger
 
 
+def _stop_listener(logger: logging.Logger):
+    """Stop and detach the queue listener installed by a previous setup_logging()."""
+    listener = getattr(logger, '_qlistener', None)
+    if listener is None:
+        return
+    listener.stop()  # Drains records already queued
+    atexit.unregister(listener.stop)
+    logger._qlistener = None
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get or create a logger instance.
     
     If logging hasn't been configured yet, sets it up with defaults.
+    Loggers are cached, so repeat calls cost a single dict lookup.
     
     Args:
         name: Logger name (uses module name if None)
@@ -137,21 +210,22 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         >>> logger = get_logger(__name__)
         >>> logger.info("Module started")
     """
-    if name is None:
-        name = 'reachy_recognizer'
-    
+    cached = _loggers.get(name or 'reachy_recognizer')
+    if cached is not None:
+        return cached
+    return _slow_get_logger(name or 'reachy_recognizer')
+
+
+def _slow_get_logger(name: str) -> logging.Logger:
+    """Configure logging on first use, or create and cache a child logger."""
     # If not configured, configure now
     if not _logging_configured:
         return setup_logging(name)
     
-    # Return existing or create child logger
-    if name in _loggers:
-        return _loggers[name]
-    else:
-        # Create child logger
-        logger = logging.getLogger(name)
-        _loggers[name] = logger
-        return logger
+    # Create child logger
+    logger = logging.getLogger(name)
+    _loggers[name] = logger
+    return logger
 
 
 def log_event(
@@ -169,7 +243,8 @@ def log_event(
     
     Args:
         logger: Logger instance
-        level: Log level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+        level: Log level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL');
+            unknown names log at INFO
         message: Log message
         event: Event type for categorization
         data: Structured event data
@@ -183,6 +258,18 @@ def log_event(
         ...     metrics={'recognition_time_ms': 45.2}
         ... )
     """
+    lvl = _LEVEL_MAP.get(level)
+    if lvl is None:
+        lvl = _LEVEL_MAP.get(level.upper(), logging.INFO)
+    
+    # Skip building the structured payload when the record would be dropped
+    if not logger.isEnabledFor(lvl):
+        return
+    
+    if not (event or data or metrics):
+        logger.log(lvl, message)
+        return
+    
     extra = {}
     if event:
         extra['event'] = event
@@ -191,5 +278,4 @@ def log_event(
     if metrics:
         extra['metrics'] = metrics
     
-    log_func = getattr(logger, level.lower())
-    log_func(message, extra=extra)
+    logger.log(lvl, message, extra=extra)
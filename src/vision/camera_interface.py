@@ -8,6 +8,8 @@ Provides frame capture with error handling and resource management.
 import cv2
 import numpy as np
 import logging
+import queue
+import threading
 from typing import Tuple, Optional
 
 logging.basicConfig(level=logging.INFO)
@@ -101,6 +103,70 @@ class CameraInterface:
         self.release()
 
 
+class LatestFrameQueue:
+    """
+    Single-slot frame hand-off between a capture thread and a consumer.
+    
+    A new frame replaces one the consumer hasn't taken yet instead of
+    queueing behind it, so the consumer always works on the newest frame
+    and latency stays bounded to one frame period when processing stalls.
+    
+    Attributes:
+        dropped_frames: Number of frames replaced before being consumed
+    """
+    
+    def __init__(self):
+        """Initialize an empty, open frame queue."""
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._closed = threading.Event()
+        self.dropped_frames = 0
+    
+    def put_latest(self, frame: np.ndarray):
+        """
+        Offer a frame, dropping the pending one if it wasn't consumed.
+        
+        Args:
+            frame: Captured frame
+        """
+        while True:
+            try:
+                self._queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped_frames += 1
+                except queue.Empty:
+                    pass
+    
+    def poll_latest_frame(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Take the newest frame.
+        
+        Args:
+            timeout: Seconds to wait for a frame (None waits indefinitely,
+                0 returns immediately)
+            
+        Returns:
+            Newest frame, or None if no frame arrived in time
+        """
+        try:
+            if timeout == 0:
+                return self._queue.get_nowait()
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def close(self):
+        """Mark the end of the stream (frames already queued can still be taken)."""
+        self._closed.set()
+    
+    @property
+    def closed(self) -> bool:
+        """True once the producer called close()."""
+        return self._closed.is_set()
+
+
 def main():
     """Test camera interface."""
     print("Testing Camera Interface...")
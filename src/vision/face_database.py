@@ -2,7 +2,9 @@
 Face Database Module - Story 2.2
 
 Manages storage and retrieval of face encodings with person names/IDs.
-Supports JSON serialization for persistence across sessions.
+Supports JSON serialization for persistence across sessions. A saved file is
+one JSON header line (names, metadata, shape) followed by the raw float32
+encoding matrix, Blosc-compressed when the blosc package is installed.
 
 Compatible with face_recognition library format for future upgrades.
 """
@@ -13,31 +15,102 @@ from pathlib import Path
 from typing import Optional, List, Tuple, Dict, Any, Union
 from datetime import datetime
 import logging
-import shutil
+import os
+import time
 
 from .face_encoder import FaceEncoder
 from .face_detector import FaceDetector
 
-logging.basicConfig(level=logging.INFO)
+# Optional fast JSON codec (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional compression for the encoding matrix
+try:
+    import blosc
+    BLOSC_AVAILABLE = True
+except ImportError:
+    BLOSC_AVAILABLE = False
+
+# "compression" values of the saved envelope
+COMPRESSION_NONE = "none"
+COMPRESSION_BLOSC = "blosc-lz4-shuffle"
+
+# Module logger only; handlers are installed by the application
+# (src/logging/setup_logging.py) or by the __main__ demo below
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize a database header to single-line JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _fsync_dir(directory: Path):
+    """Flush a directory entry so a completed rename survives a crash (POSIX only)."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _l2_normalize(encodings: np.ndarray) -> np.ndarray:
+    """L2-normalize one encoding or each row of a matrix (zero vectors stay zero)."""
+    norms = np.linalg.norm(encodings, axis=-1, keepdims=True)
+    return (encodings / np.maximum(norms, 1e-12)).astype(np.float32, copy=False)
+
+
+def _iso(timestamp: float) -> str:
+    """Format an epoch timestamp as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse a database header or legacy JSON database from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class FaceDatabase:
     """
     Manage database of known face encodings.
     
     Stores face encodings with associated person names and metadata.
-    Supports loading/saving to JSON files for persistence.
+    Supports loading/saving to files for persistence.
+    
+    Faces are kept as parallel arrays: a names list, a metadata list and
+    one (N, 128) float32 matrix of L2-normalized encodings (grown by
+    doubling), plus a name -> row index. Cosine similarity against all
+    known faces is therefore a single matrix product, and saving writes
+    the matrix as-is. On disk a JSON header line with the names and
+    metadata is followed by the raw matrix bytes. Version 1.0 files (one
+    JSON float list per face) are still loaded.
+    
+    Loading validates the header before reading the matrix, and only
+    decodes the matrix on first access to an encoding, so name and size
+    queries never pay for it.
     
     Attributes:
-        database: Dictionary mapping person names to face data
+        database: Read-only dict view {name: {"encoding", "metadata"}}
         encoder: FaceEncoder instance for generating encodings
         detector: FaceDetector instance for face detection
         encoding_dim: Dimension of face encodings (128)
+        encoding_dim_bytes: Bytes per stored encoding (128 float32 = 512)
         version: Database schema version
     """
     
-    VERSION = "1.0"
+    VERSION = "3.0"
+    LEGACY_VERSIONS = ("1.0",)
+    INITIAL_CAPACITY = 16
     
     def __init__(self, encoder: Optional[FaceEncoder] = None, detector: Optional[FaceDetector] = None):
         """
@@ -47,18 +120,79 @@ class FaceDatabase:
             encoder: FaceEncoder instance (creates new one if None)
             detector: FaceDetector instance (creates new one if None)
         """
-        self.database: Dict[str, Dict[str, Any]] = {}
         self.encoder = encoder if encoder is not None else FaceEncoder()
         self.detector = detector if detector is not None else FaceDetector()
         self.encoding_dim = 128
-        self.created_at = datetime.now().isoformat()
-        self.updated_at = self.created_at
+        self.encoding_dim_bytes = self.encoding_dim * np.dtype(np.float32).itemsize
+        # Parallel per-face storage; row i of _encodings belongs to _names[i]
+        self._names: List[str] = []
+        self._name_to_idx: Dict[str, int] = {}
+        self._metadata: List[Dict[str, Any]] = []
+        self._encodings = np.empty((self.INITIAL_CAPACITY, self.encoding_dim), dtype=np.float32)
+        # Tuple of _names handed out by get_encoding_matrix(); None when stale
+        self._names_snapshot: Optional[Tuple[str, ...]] = None
+        # (header, blob) from load_database() whose encodings are not decoded yet
+        self._pending: Optional[Tuple[Dict[str, Any], bytes]] = None
+        # Epoch seconds; ISO strings are only built when read
+        self._created_at = time.time()
+        self._updated_at = self._created_at
         
         logger.info(f"FaceDatabase initialized (version {self.VERSION})")
     
+    @property
+    def database(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Dict view of the faces, {name: {"encoding": ndarray, "metadata": dict}}.
+        
+        Built on each access for backward compatibility; changes to the
+        returned dict are not written back (use set_encoding()).
+        """
+        self._ensure_decoded()
+        return {
+            name: {"encoding": self._encodings[idx], "metadata": self._metadata[idx]}
+            for idx, name in enumerate(self._names)
+        }
+    
+    @property
+    def created_at(self) -> str:
+        """Creation time as an ISO 8601 string."""
+        return _iso(self._created_at)
+    
+    @property
+    def updated_at(self) -> str:
+        """Last modification time as an ISO 8601 string."""
+        return _iso(self._updated_at)
+    
+    @staticmethod
+    def _crop_face(image: np.ndarray, face_location: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Crop a detected face out of a frame.
+        
+        Returns a view into the frame, clamped to its bounds; no pixels are
+        copied until the encoder resizes the crop.
+        
+        Args:
+            image: Full frame (BGR format)
+            face_location: Face bounding box as (top, right, bottom, left)
+            
+        Returns:
+            Face region of the frame
+        """
+        top, right, bottom, left = face_location
+        height, width = image.shape[:2]
+        return image[max(0, top):min(height, bottom), max(0, left):min(width, right)]
+    
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> float:
+        """Parse a saved ISO timestamp, falling back to the current time."""
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (TypeError, ValueError):
+            return time.time()
+    
     def add_face(
-        self, 
-        name: str, 
+        self,
+        name: str,
         image: np.ndarray,
         metadata: Optional[Dict[str, Any]] = None,
         auto_detect: bool = True
@@ -92,8 +226,7 @@ class FaceDatabase:
                     logger.warning(f"Multiple faces detected for '{name}', using first face")
                 
                 # Extract first face
-                top, right, bottom, left = faces[0]
-                face_image = image[top:bottom, left:right]
+                face_image = self._crop_face(image, faces[0])
             else:
                 face_image = image
             
@@ -107,16 +240,15 @@ class FaceDatabase:
             if metadata is None:
                 metadata = {}
             
-            metadata["added_at"] = datetime.now().isoformat()
+            now = time.time()
+            metadata["added_at"] = _iso(now)
             metadata["detection_method"] = "auto" if auto_detect else "manual"
             
             # Store in database
-            self.database[name] = {
-                "encoding": encoding.tolist(),  # Convert to list for JSON serialization
-                "metadata": metadata
-            }
+            self._ensure_decoded()
+            self._store(name, _l2_normalize(np.asarray(encoding, dtype=np.float32)), metadata)
             
-            self.updated_at = datetime.now().isoformat()
+            self._updated_at = now
             
             logger.info(f"✓ Added face for '{name}' to database")
             return True
@@ -125,19 +257,133 @@ class FaceDatabase:
             logger.error(f"Failed to add face for '{name}': {e}")
             return False
     
+    def add_faces_batch(
+        self,
+        items: List[Tuple[str, np.ndarray]],
+        auto_detect: bool = True
+    ) -> List[bool]:
+        """
+        Add several faces to the database at once.
+        
+        Faces are cropped first and then encoded in one batched encoder
+        call; the encoding matrix is grown at most once for the batch.
+        
+        Args:
+            items: List of (name, image) pairs, as for add_face()
+            auto_detect: If True, auto-detect face in each image
+            
+        Returns:
+            List of success flags, one per item
+            
+        Example:
+            >>> db = FaceDatabase()
+            >>> items = [(p.stem, cv2.imread(str(p))) for p in Path("faces").glob("*.jpg")]
+            >>> results = db.add_faces_batch(items)
+            >>> print(f"Added {sum(results)}/{len(items)}")
+        """
+        results = [False] * len(items)
+        
+        # Crop all faces first
+        crops = []
+        crop_items = []
+        for i, (name, image) in enumerate(items):
+            if auto_detect:
+                faces = self.detector.detect_faces(image)
+                if len(faces) == 0:
+                    logger.warning(f"No face detected in image for '{name}'")
+                    continue
+                elif len(faces) > 1:
+                    logger.warning(f"Multiple faces detected for '{name}', using first face")
+                
+                crops.append(self._crop_face(image, faces[0]))
+            else:
+                crops.append(image)
+            crop_items.append(i)
+        
+        if not crops:
+            return results
+        
+        try:
+            encodings = self.encoder.batch_encode_faces(crops, normalize=True)
+        except Exception as e:
+            logger.error(f"Failed to encode face batch: {e}")
+            return results
+        
+        # Store all encodings under a single timestamp
+        self._ensure_decoded()
+        self._reserve(len(self._names) + len(crops))
+        now = time.time()
+        added_at = _iso(now)
+        detection_method = "auto" if auto_detect else "manual"
+        added = 0
+        for i, encoding in zip(crop_items, encodings):
+            name = items[i][0]
+            if encoding is None:
+                logger.error(f"Failed to generate encoding for '{name}'")
+                continue
+            
+            self._store(
+                name,
+                _l2_normalize(np.asarray(encoding, dtype=np.float32)),
+                {"added_at": added_at, "detection_method": detection_method}
+            )
+            results[i] = True
+            added += 1
+        
+        if added:
+            self._updated_at = now
+            logger.info(f"✓ Added {added}/{len(items)} faces to database")
+        return results
+    
+    def set_encoding(self, name: str, encoding: np.ndarray) -> bool:
+        """
+        Replace the stored encoding of an existing person.
+        
+        Args:
+            name: Person's name/ID
+            encoding: New 128-d encoding (normalized before storing)
+            
+        Returns:
+            True if updated, False if the person is not in the database
+        """
+        idx = self._name_to_idx.get(name)
+        if idx is None:
+            logger.warning(f"'{name}' not found in database")
+            return False
+        
+        self._ensure_decoded()
+        self._reserve(len(self._names))
+        self._encodings[idx] = _l2_normalize(np.asarray(encoding, dtype=np.float32))
+        self._updated_at = time.time()
+        return True
+    
     def remove_face(self, name: str) -> bool:
         """
         Remove a face from the database.
         
+        Later rows shift up one place, so the remaining names keep their
+        insertion order.
+        
         Args:
             name: Person's name/ID to remove
             
         Returns:
             True if removed, False if not found
         """
-        if name in self.database:
-            del self.database[name]
-            self.updated_at = datetime.now().isoformat()
+        if name in self._name_to_idx:
+            self._ensure_decoded()
+            self._reserve(len(self._names))
+            
+            idx = self._name_to_idx.pop(name)
+            n = len(self._names)
+            self._encodings[idx:n - 1] = self._encodings[idx + 1:n]
+            del self._names[idx]
+            del self._metadata[idx]
+            for row in range(idx, n - 1):
+                self._name_to_idx[self._names[row]] = row
+            self._names_snapshot = None
+            
+            self._updated_at = time.time()
             logger.info(f"✓ Removed '{name}' from database")
             return True
         else:
@@ -154,11 +400,11 @@ class FaceDatabase:
         Returns:
             Face encoding as numpy array, or None if not found
         """
-        if name in self.database:
-            encoding_list = self.database[name]["encoding"]
-            return np.array(encoding_list)
-        else:
+        idx = self._name_to_idx.get(name)
+        if idx is None:
             return None
+        self._ensure_decoded()
+        return self._encodings[idx].copy()
     
     def get_all_encodings(self) -> List[Tuple[str, np.ndarray]]:
         """
@@ -173,12 +419,69 @@ class FaceDatabase:
             >>> for name, encoding in db.get_all_encodings():
             >>>     print(f"{name}: {encoding.shape}")
         """
-        encodings = []
-        for name, data in self.database.items():
-            encoding = np.array(data["encoding"])
-            encodings.append((name, encoding))
+        names, matrix = self.get_encoding_matrix()
+        return list(zip(names, matrix))
+    
+    def get_encoding_matrix(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """
+        Get all face encodings as one stacked matrix.
         
-        return encodings
+        The matrix is a read-only view of the storage rather than a copy,
+        so callers can compare against every known face with a single
+        matrix product. The result is valid only until the next mutation
+        of the database (add, remove, set_encoding, clear or load); call
+        again afterwards instead of holding on to it.
+        
+        Returns:
+            Tuple of (names, matrix) where names is a tuple, matrix is a
+            read-only (N, 128) float32 array and row i is the encoding of
+            names[i]
+            
+        Example:
+            >>> names, known = db.get_encoding_matrix()
+            >>> similarities = known @ query_encoding
+            >>> best = names[int(np.argmax(similarities))]
+        """
+        self._ensure_decoded()
+        if self._names_snapshot is None:
+            self._names_snapshot = tuple(self._names)
+        matrix = self._encodings[:len(self._names)]
+        matrix.flags.writeable = False
+        return self._names_snapshot, matrix
+    
+    def match(self, query: np.ndarray, top_k: int = 1) -> List[Tuple[str, float]]:
+        """
+        Find the known faces most similar to a query encoding.
+        
+        Scores every stored face with one matrix-vector product (cosine
+        similarity, since stored encodings are L2-normalized).
+        
+        Args:
+            query: 128-d face encoding (normalized before scoring)
+            top_k: Number of best matches to return
+            
+        Returns:
+            Up to top_k (name, similarity) tuples, best first; empty if the
+            database is empty
+            
+        Example:
+            >>> name, score = db.match(encoding)[0]
+        """
+        names, matrix = self.get_encoding_matrix()
+        if len(names) == 0 or top_k < 1:
+            return []
+        
+        scores = matrix @ _l2_normalize(np.asarray(query, dtype=np.float32))
+        if top_k == 1:
+            best = int(np.argmax(scores))
+            return [(names[best], float(scores[best]))]
+        
+        if top_k < len(names):
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(names))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(names[i], float(scores[i])) for i in top]
     
     def get_metadata(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -190,30 +493,34 @@ class FaceDatabase:
         Returns:
             Metadata dictionary, or None if not found
         """
-        if name in self.database:
-            return self.database[name]["metadata"]
-        else:
+        idx = self._name_to_idx.get(name)
+        if idx is None:
             return None
+        return self._metadata[idx]
     
     def get_all_names(self) -> List[str]:
         """Get list of all person names in database."""
-        return list(self.database.keys())
+        return list(self._names)
     
     def size(self) -> int:
         """Get number of faces in database."""
-        return len(self.database)
+        return len(self._names)
     
     def is_empty(self) -> bool:
         """Check if database is empty."""
-        return len(self.database) == 0
+        return len(self._names) == 0
     
     def save_database(self, filepath: Union[str, Path], create_backup: bool = True) -> bool:
         """
-        Save database to JSON file.
+        Save database to file (JSON header line + raw encoding matrix).
+        
+        The file is written to a temporary sibling, synced, and then
+        renamed over the target, so a crash never leaves a partial file.
+        The previous file becomes the backup without being copied.
         
         Args:
-            filepath: Path to save JSON file
-            create_backup: If True, backup existing file before overwriting
+            filepath: Path to save database file
+            create_backup: If True, keep the existing file as <filepath>.bak
             
         Returns:
             True if saved successfully, False otherwise
@@ -223,46 +530,81 @@ class FaceDatabase:
             >>> db.add_face("Michelle", image)
             >>> db.save_database("faces.json")
         """
+        tmp_path = None
         try:
             filepath = Path(filepath)
             
-            # Create backup if file exists
-            if create_backup and filepath.exists():
-                backup_path = filepath.with_suffix(filepath.suffix + ".bak")
-                shutil.copy2(filepath, backup_path)
-                logger.info(f"Created backup: {backup_path}")
-            
-            # Prepare database export
-            export_data = {
+            # Prepare database export (encodings as one float32 matrix,
+            # byte-shuffled and LZ4-compressed when Blosc is available)
+            names, matrix = self.get_encoding_matrix()
+            raw = matrix.tobytes()
+            if BLOSC_AVAILABLE:
+                raw = blosc.compress(raw, typesize=4, cname='lz4', shuffle=blosc.SHUFFLE)
+                compression = COMPRESSION_BLOSC
+            else:
+                compression = COMPRESSION_NONE
+            header = {
                 "version": self.VERSION,
                 "created_at": self.created_at,
-                "updated_at": datetime.now().isoformat(),
+                "updated_at": _iso(time.time()),
                 "encoding_dim": self.encoding_dim,
                 "model": "SFace_128d",
-                "num_faces": len(self.database),
-                "faces": self.database
+                "num_faces": len(names),
+                "names": names,
+                "metadata": self._metadata,
+                "dtype": "float32",
+                "shape": list(matrix.shape),
+                "l2_normalized": True,
+                "compression": compression,
+                "encodings_bytes": len(raw)
             }
             
             # Ensure parent directory exists
             filepath.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write JSON file
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Write header line + matrix bytes to a temporary file and make it durable
+            tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(header))
+                f.write(b"\n")
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Keep the current file as the backup (hard link: no bytes copied,
+            # and the target stays in place until the atomic replace below)
+            if create_backup and filepath.exists():
+                backup_path = filepath.with_suffix(filepath.suffix + ".bak")
+                backup_path.unlink(missing_ok=True)
+                try:
+                    os.link(filepath, backup_path)
+                except OSError:
+                    # Filesystem without hard links: move the file aside instead
+                    os.replace(filepath, backup_path)
+                logger.info(f"Created backup: {backup_path}")
             
-            logger.info(f"✓ Saved database to {filepath} ({len(self.database)} faces)")
+            # Atomically swap the new file into place
+            os.replace(tmp_path, filepath)
+            _fsync_dir(filepath.parent)
+            
+            logger.info(f"✓ Saved database to {filepath} ({len(names)} faces)")
             return True
             
         except Exception as e:
             logger.error(f"Failed to save database: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             return False
     
     def load_database(self, filepath: Union[str, Path], merge: bool = False) -> bool:
         """
-        Load database from JSON file.
+        Load database from file.
+        
+        The header line is validated before the encoding matrix is read,
+        so an incompatible file is rejected without loading its body.
         
         Args:
-            filepath: Path to JSON file
+            filepath: Path to database file
             merge: If True, merge with existing database; if False, replace
             
         Returns:
@@ -280,33 +622,72 @@ class FaceDatabase:
                 logger.error(f"Database file not found: {filepath}")
                 return False
             
-            # Load JSON file
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            # Validate schema version
-            if data.get("version") != self.VERSION:
-                logger.warning(f"Database version mismatch: {data.get('version')} vs {self.VERSION}")
-            
-            # Validate encoding dimension
-            if data.get("encoding_dim") != self.encoding_dim:
-                logger.error(f"Encoding dimension mismatch: {data.get('encoding_dim')} vs {self.encoding_dim}")
-                return False
-            
-            # Load faces
-            loaded_faces = data.get("faces", {})
+            with open(filepath, 'rb') as f:
+                # Read only the header line first; a legacy JSON file either
+                # fits on that line or fails to parse and is read whole
+                first_line = f.readline()
+                try:
+                    data = _json_loads(first_line)
+                except ValueError:
+                    data = None
+                if not isinstance(data, dict):
+                    data = _json_loads(first_line + f.read())
+                
+                # Validate schema version
+                version = data.get("version")
+                if version != self.VERSION and version not in self.LEGACY_VERSIONS:
+                    logger.warning(f"Database version mismatch: {version} vs {self.VERSION}")
+                
+                # Validate encoding dimension before reading the encodings
+                if data.get("encoding_dim") != self.encoding_dim:
+                    logger.error(f"Encoding dimension mismatch: {data.get('encoding_dim')} vs {self.encoding_dim}")
+                    return False
+                
+                if "encodings_bytes" in data:
+                    blob = f.read()
+                else:
+                    blob = None
+            
+            # Load faces as parallel lists (matrix stays None while deferred)
+            if blob is not None:
+                names = self._check_encoded_faces(data, blob)
+                metadata = data.get("metadata", [{} for _ in names])
+                deferred = not merge and len(set(names)) == len(names)
+                matrix = None if deferred else self._decode_matrix(data, blob)
+            else:
+                # Version 1.0: {"faces": {name: {"encoding": [...], "metadata": {...}}}}
+                faces = data.get("faces", {})
+                names = list(faces)
+                metadata = [face.get("metadata", {}) for face in faces.values()]
+                matrix = _l2_normalize(
+                    np.asarray([face["encoding"] for face in faces.values()], dtype=np.float32)
+                    .reshape(-1, self.encoding_dim)
+                )
             
             if merge:
                 # Merge with existing database
-                self.database.update(loaded_faces)
-                logger.info(f"✓ Merged {len(loaded_faces)} faces from {filepath}")
+                self._ensure_decoded()
+                self._reserve(len(self._names) + len(names))
+                for row, (name, meta) in enumerate(zip(names, metadata)):
+                    self._store(name, matrix[row], meta)
+                logger.info(f"✓ Merged {len(names)} faces from {filepath}")
             else:
                 # Replace existing database
-                self.database = loaded_faces
-                self.created_at = data.get("created_at", datetime.now().isoformat())
-                logger.info(f"✓ Loaded {len(loaded_faces)} faces from {filepath}")
-            
-            self.updated_at = datetime.now().isoformat()
+                if matrix is None:
+                    self._encodings = np.empty((0, self.encoding_dim), dtype=np.float32)
+                    self._pending = (data, blob)
+                else:
+                    names, metadata, matrix = self._dedupe(names, metadata, matrix)
+                    self._encodings = matrix
+                    self._pending = None
+                self._names = list(names)
+                self._names_snapshot = None
+                self._metadata = list(metadata)
+                self._name_to_idx = {name: idx for idx, name in enumerate(self._names)}
+                self._created_at = self._parse_timestamp(data.get("created_at"))
+                logger.info(f"✓ Loaded {len(self._names)} faces from {filepath}")
+            
+            self._updated_at = time.time()
             
             return True
             
@@ -314,18 +695,131 @@ class FaceDatabase:
             logger.error(f"Failed to load database: {e}")
             return False
     
+    def _store(self, name: str, encoding: np.ndarray, metadata: Dict[str, Any]):
+        """Insert or overwrite one face (encodings must already be decoded)."""
+        idx = self._name_to_idx.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self._reserve(idx + 1)
+            self._names.append(name)
+            self._metadata.append(metadata)
+            self._name_to_idx[name] = idx
+            self._names_snapshot = None
+        else:
+            self._reserve(len(self._names))
+            self._metadata[idx] = metadata
+        self._encodings[idx] = encoding
+    
+    def _reserve(self, capacity: int):
+        """
+        Make the encoding matrix writable with room for `capacity` rows.
+        
+        Grows by doubling, so appends are amortized O(1). A matrix decoded
+        straight from a file is read-only and is copied on first write.
+        """
+        current = self._encodings.shape[0]
+        if capacity <= current and self._encodings.flags.writeable:
+            return
+        
+        new_capacity = max(capacity, 2 * current, self.INITIAL_CAPACITY)
+        encodings = np.empty((new_capacity, self.encoding_dim), dtype=np.float32)
+        n = len(self._names)
+        encodings[:n] = self._encodings[:n]
+        self._encodings = encodings
+    
+    @staticmethod
+    def _dedupe(
+        names: List[str], metadata: List[Dict[str, Any]], matrix: np.ndarray
+    ) -> Tuple[List[str], List[Dict[str, Any]], np.ndarray]:
+        """Drop repeated names from loaded rows, keeping the last row of each."""
+        last_row = {name: row for row, name in enumerate(names)}
+        if len(last_row) == len(names):
+            return names, metadata, matrix
+        rows = list(last_row.values())
+        return list(last_row), [metadata[row] for row in rows], matrix[rows]
+    
+    def _check_encoded_faces(self, data: Dict[str, Any], blob: bytes) -> List[str]:
+        """
+        Validate the encoding matrix of a saved database without decoding it.
+        
+        Args:
+            data: Parsed database header
+            blob: Matrix bytes read after the header
+            
+        Returns:
+            List of names, one per matrix row
+            
+        Raises:
+            ValueError: If the matrix does not match the names, dtype or
+                compression
+        """
+        names = data.get("names", [])
+        if data.get("dtype", "float32") != "float32":
+            raise ValueError(f"Unsupported encoding dtype: {data.get('dtype')}")
+        
+        if len(blob) != data["encodings_bytes"]:
+            raise ValueError(
+                f"Truncated encodings: {len(blob)} of {data['encodings_bytes']} bytes"
+            )
+        
+        compression = data.get("compression", COMPRESSION_NONE)
+        if compression == COMPRESSION_NONE:
+            size = len(blob)
+        elif compression == COMPRESSION_BLOSC:
+            if not BLOSC_AVAILABLE:
+                raise ValueError("Database encodings are Blosc-compressed but blosc is not installed")
+            # Uncompressed size is in the 16-byte Blosc header
+            size = blosc.get_cbuffer_sizes(blob[:16])[0] if blob else 0
+        else:
+            raise ValueError(f"Unsupported encoding compression: {compression}")
+        
+        if size != len(names) * self.encoding_dim_bytes:
+            raise ValueError(
+                f"Encoding buffer size mismatch: {size} bytes for {len(names)} names "
+                f"({self.encoding_dim_bytes} bytes each)"
+            )
+        return names
+    
+    def _decode_matrix(self, data: Dict[str, Any], blob: bytes) -> np.ndarray:
+        """
+        Decode the encoding blob of a saved database into an (N, dim) matrix.
+        
+        Files written before encodings were normalized at storage time
+        (no "l2_normalized" flag) are normalized here.
+        """
+        if data.get("compression", COMPRESSION_NONE) == COMPRESSION_BLOSC and blob:
+            blob = blosc.decompress(blob)
+        matrix = np.frombuffer(blob, dtype=np.float32).reshape(-1, self.encoding_dim)
+        if not data.get("l2_normalized", False):
+            matrix = _l2_normalize(matrix)
+        return matrix
+    
+    def _ensure_decoded(self):
+        """Decode the encoding matrix deferred by load_database()."""
+        if self._pending is None:
+            return
+        
+        # Rows are in the same order as the already loaded names
+        self._encodings = self._decode_matrix(*self._pending)
+        self._pending = None
+    
     def clear(self):
         """Clear all faces from database."""
-        self.database = {}
-        self.updated_at = datetime.now().isoformat()
+        self._names = []
+        self._names_snapshot = None
+        self._name_to_idx = {}
+        self._metadata = []
+        self._encodings = np.empty((self.INITIAL_CAPACITY, self.encoding_dim), dtype=np.float32)
+        self._pending = None
+        self._updated_at = time.time()
         logger.info("Database cleared")
     
     def get_info(self) -> Dict[str, Any]:
         """Get database information."""
         return {
             "version": self.VERSION,
-            "num_faces": len(self.database),
-            "names": list(self.database.keys()),
+            "num_faces": len(self._names),
+            "names": list(self._names),
             "encoding_dim": self.encoding_dim,
             "created_at": self.created_at,
             "updated_at": self.updated_at
@@ -448,4 +942,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -17,8 +17,18 @@ Future: Can be upgraded to face_recognition library when build environment permi
 import cv2
 import numpy as np
 from typing import List, Tuple
+import os
+import queue
+import threading
 import time
 
+# ONNX Runtime (optional - faster CPU executor for the SSD model)
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
 
 class FaceDetector:
     """
@@ -27,6 +37,9 @@ class FaceDetector:
     Uses a pre-trained Caffe model for robust face detection.
     """
     
+    # Frames wider than this are downscaled before the Haar cascade runs
+    HAAR_DETECT_WIDTH = 320
+    
     def __init__(self, confidence_threshold: float = 0.5):
         """
         Initialize the DNN face detector.
@@ -36,6 +49,24 @@ class FaceDetector:
         """
         self.confidence_threshold = confidence_threshold
         self.net = None
+        self.yunet = None
+        self._ort = None
+        self._ort_input = None
+        self._fp16_target = None  # Set while the FP16 check is pending
+        
+        # Reused SSD input buffers, filled in place by _detect_dnn
+        self._small = np.empty((300, 300, 3), dtype=np.uint8)
+        self._blob = np.empty((1, 3, 300, 300), dtype=np.float32)
+        self._mean = (104.0, 177.0, 123.0)
+        
+        # detect_faces_cached() state
+        self._last_hash = None
+        self._last_faces: List[Tuple[int, int, int, int]] = []
+        self._cache_age = 0
+        
+        # Let OpenCV's preprocessing and DNN forward pass use every core
+        cv2.setNumThreads(os.cpu_count() or 1)
+        
         self.model_loaded = False
         self.load_model()
     
@@ -53,6 +84,26 @@ class FaceDetector:
             # For now, we'll use a simpler approach with the available Haar cascade
             # and document the upgrade path to DNN in the future
             
+            # Prefer YuNet: far smaller and faster than the SSD, with NMS built in
+            self.yunet = self._load_yunet_model()
+            if self.yunet is not None:
+                self.model_loaded = True
+                print(f"✓ Loaded YuNet face detector (ONNX model)")
+                return
+            
+            # Next, the INT8 OpenVINO IR of the SSD model if it was exported
+            self.net = self._load_openvino_model()
+            if self.net is not None:
+                self.model_loaded = True
+                print(f"✓ Loaded DNN face detector (OpenVINO INT8 SSD model)")
+                return
+            
+            # Next, the ONNX export of the SSD model on ONNX Runtime
+            if self._load_onnxruntime_model():
+                self.model_loaded = True
+                print(f"✓ Loaded DNN face detector (ONNX Runtime SSD model)")
+                return
+            
             # Alternative: Use pre-trained DNN model if available
             prototxt = "models/deploy.prototxt"
             caffemodel = "models/res10_300x300_ssd_iter_140000.caffemodel"
@@ -61,18 +112,166 @@ class FaceDetector:
                 self.net = cv2.dnn.readNetFromCaffe(prototxt, caffemodel)
                 self.model_loaded = True
                 print(f"✓ Loaded DNN face detector (Caffe SSD model)")
+                self._select_dnn_target()
             except:
-                # Fallback: Use Haar cascade if DNN models not available
-                print("⚠ DNN models not found, using Haar cascade fallback")
-                self.cascade = cv2.CascadeClassifier(
-                    cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                # Fallback: Use a cascade if DNN models not available; LBP
+                # (integer features) is roughly twice as fast as Haar
+                print("⚠ DNN models not found, using cascade fallback")
+                lbp_file = os.path.join(
+                    cv2.data.haarcascades.replace("haarcascades", "lbpcascades"),
+                    'lbpcascade_frontalface_improved.xml'
                 )
+                self.cascade = None
+                if os.path.exists(lbp_file):
+                    self.cascade = cv2.CascadeClassifier(lbp_file)
+                    if self.cascade.empty():
+                        self.cascade = None
+                    else:
+                        print(f"✓ Loaded LBP cascade face detector (fallback)")
+                
+                if self.cascade is None:
+                    self.cascade = cv2.CascadeClassifier(
+                        cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                    )
+                    print(f"✓ Loaded Haar cascade face detector (fallback)")
                 self.model_loaded = False
-                print(f"✓ Loaded Haar cascade face detector (fallback)")
                 
         except Exception as e:
             raise RuntimeError(f"Failed to load face detection model: {e}")
     
+    def _load_yunet_model(self):
+        """
+        Load the YuNet face detector from opencv_zoo.
+        
+        Returns:
+            cv2.FaceDetectorYN instance, or None if the ONNX model is missing
+            or this OpenCV build has no FaceDetectorYN
+        """
+        onnx_model = "models/face_detection_yunet_2023mar.onnx"
+        
+        if not os.path.exists(onnx_model) or not hasattr(cv2, 'FaceDetectorYN'):
+            return None
+        
+        try:
+            # Input size is set per frame in _detect_yunet
+            return cv2.FaceDetectorYN.create(
+                onnx_model, "", (0, 0), self.confidence_threshold, 0.3, 5000
+            )
+        except Exception as e:
+            print(f"⚠ YuNet face detector unavailable, using SSD model: {e}")
+            return None
+    
+    def _load_openvino_model(self):
+        """
+        Load the INT8-quantized OpenVINO IR of the SSD face detector.
+        
+        The IR is produced offline from the Caffe model (ONNX export, NNCF
+        quantization, Model Optimizer) and must sit next to the Caffe files.
+        
+        Returns:
+            cv2.dnn network on the Inference Engine backend, or None if the IR
+            files are missing or this OpenCV build lacks OpenVINO support
+        """
+        xml = "models/face_detector.xml"
+        bin_file = "models/face_detector.bin"
+        
+        if not (os.path.exists(xml) and os.path.exists(bin_file)):
+            return None
+        
+        try:
+            net = cv2.dnn.readNetFromModelOptimizer(xml, bin_file)
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+            net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            return net
+        except Exception as e:
+            print(f"⚠ OpenVINO face detector unavailable, using Caffe model: {e}")
+            return None
+    
+    def _load_onnxruntime_model(self) -> bool:
+        """
+        Load the ONNX export of the SSD face detector into ONNX Runtime.
+        
+        Returns:
+            True if the session was created, False if onnxruntime isn't
+            installed, the ONNX file is missing, or the session failed
+        """
+        onnx_model = "models/face_detector.onnx"
+        
+        if not ONNXRUNTIME_AVAILABLE or not os.path.exists(onnx_model):
+            return False
+        
+        try:
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.intra_op_num_threads = os.cpu_count() or 1
+            
+            providers = [
+                p for p in ('DnnlExecutionProvider', 'CPUExecutionProvider')
+                if p in ort.get_available_providers()
+            ]
+            self._ort = ort.InferenceSession(onnx_model, options, providers=providers)
+            self._ort_input = self._ort.get_inputs()[0].name
+            return True
+        except Exception as e:
+            print(f"⚠ ONNX Runtime face detector unavailable, using OpenCV DNN: {e}")
+            self._ort = None
+            return False
+    
+    def _select_dnn_target(self):
+        """
+        Run the Caffe SSD on the CPU in FP32 and arm the FP16 check.
+        
+        FP16 is only switched on after _validate_fp16 has compared both
+        precisions on a real frame with faces in it (see _detect_dnn).
+        """
+        self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+        self._fp16_target = getattr(cv2.dnn, 'DNN_TARGET_CPU_FP16', None)
+    
+    def _validate_fp16(self, blob: np.ndarray, reference: np.ndarray, tolerance: float = 0.02):
+        """
+        Keep FP16 on the CPU if it matches FP32 on a frame with detections.
+        
+        Compares only the rows above confidence_threshold: FP16 must find
+        the same number of faces, with confidences and normalized box
+        coordinates each within tolerance of FP32.
+        
+        Args:
+            blob: Input blob that produced reference
+            reference: FP32 detection rows (N, 7) with at least one face
+            tolerance: Maximum allowed difference per confidence/coordinate
+        """
+        fp16_target, self._fp16_target = self._fp16_target, None
+        
+        def confident(det: np.ndarray) -> np.ndarray:
+            rows = det[det[:, 2] > self.confidence_threshold, 2:7]
+            return rows[np.argsort(-rows[:, 0], kind="stable")]
+        
+        try:
+            self.net.setPreferableTarget(fp16_target)
+            self.net.setInput(blob)
+            candidate = confident(self.net.forward()[0, 0])
+        except Exception as e:
+            print(f"⚠ FP16 DNN target unavailable, using FP32: {e}")
+            self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            return
+        
+        expected = confident(reference)
+        if candidate.shape != expected.shape or \
+                np.max(np.abs(candidate - expected), initial=0.0) > tolerance:
+            print("⚠ FP16 DNN output drifted from FP32, using FP32")
+            self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            return
+        
+        print(f"✓ Running DNN face detector with FP16 CPU target")
+    
+    @property
+    def accepts_grayscale(self) -> bool:
+        """True if detect_faces() can take single-channel frames (cascade fallback)."""
+        if self.yunet is not None:
+            return False
+        return not (self.model_loaded and (self._ort is not None or self.net is not None))
+    
     def detect_faces(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """
         Detect faces in the frame.
@@ -89,13 +288,93 @@ class FaceDetector:
         
         h, w = frame.shape[:2]
         
-        if self.model_loaded and self.net is not None:
+        if self.yunet is not None:
+            return self._detect_yunet(frame, w, h)
+        elif self.model_loaded and (self._ort is not None or self.net is not None):
             # DNN-based detection
             return self._detect_dnn(frame, w, h)
         else:
             # Haar cascade fallback
             return self._detect_haar(frame, w, h)
     
+    def detect_faces_batch(self, frames: List[np.ndarray]) -> List[List[Tuple[int, int, int, int]]]:
+        """
+        Detect faces in several frames, e.g. from stored video.
+        
+        With the SSD model all frames go through a single forward pass;
+        YuNet and the cascade fallback process the frames one by one.
+        
+        Args:
+            frames: BGR images (may differ in size)
+            
+        Returns:
+            One list of (top, right, bottom, left) tuples per input frame
+        """
+        results: List[List[Tuple[int, int, int, int]]] = [[] for _ in frames]
+        valid = [i for i, frame in enumerate(frames) if frame is not None and frame.size > 0]
+        
+        if not valid:
+            return results
+        
+        # YuNet, the cascade and ONNX Runtime (fixed batch of 1) go frame by frame
+        if self.yunet is not None or self._ort is not None or \
+                not (self.model_loaded and self.net is not None):
+            for i in valid:
+                results[i] = self.detect_faces(frames[i])
+            return results
+        
+        blob = cv2.dnn.blobFromImages(
+            [frames[i] for i in valid],
+            1.0,
+            (300, 300),
+            (104.0, 177.0, 123.0),
+            swapRB=False,
+            crop=False
+        )
+        self.net.setInput(blob)
+        
+        # Detections from all images share one (N, 7) table; column 0
+        # is the index of the image within the batch
+        det = self.net.forward().reshape(-1, 7)
+        image_ids = det[:, 0].astype(int)
+        
+        for b, i in enumerate(valid):
+            h, w = frames[i].shape[:2]
+            results[i] = self._ssd_boxes(det[image_ids == b], w, h)
+        
+        return results
+    
+    def detect_faces_cached(self, frame: np.ndarray, max_age: int = 5) -> List[Tuple[int, int, int, int]]:
+        """
+        Detect faces, reusing the previous result when the frame hasn't changed.
+        
+        Compares an 8x8 average hash of the frame with the previous one and
+        skips detection on a match, for at most max_age consecutive frames.
+        
+        Args:
+            frame: BGR image from camera (numpy array)
+            max_age: Maximum number of frames a cached result is reused
+            
+        Returns:
+            List of face bounding boxes as (top, right, bottom, left) tuples
+        """
+        if frame is None or frame.size == 0:
+            return []
+        
+        tiny = cv2.resize(frame, (8, 8), interpolation=cv2.INTER_AREA)
+        if tiny.ndim == 3:
+            tiny = tiny.mean(axis=2)
+        frame_hash = (tiny > tiny.mean()).tobytes()
+        
+        if frame_hash == self._last_hash and self._cache_age < max_age:
+            self._cache_age += 1
+            return self._last_faces
+        
+        self._last_faces = self.detect_faces(frame)
+        self._last_hash = frame_hash
+        self._cache_age = 0
+        return self._last_faces
+    
     def _detect_dnn(self, frame: np.ndarray, w: int, h: int) -> List[Tuple[int, int, int, int]]:
         """
         Detect faces using DNN model.
@@ -108,75 +387,125 @@ class FaceDetector:
         Returns:
             List of (top, right, bottom, left) tuples
         """
-        # Prepare blob from frame
-        blob = cv2.dnn.blobFromImage(
-            cv2.resize(frame, (300, 300)), 
-            1.0, 
-            (300, 300), 
-            (104.0, 177.0, 123.0)
-        )
+        # Prepare blob from frame: resize into the cached 300x300 buffer, then
+        # subtract the mean channel by channel straight into the NCHW blob
+        # (same result as blobFromImage without its per-call allocations)
+        small = cv2.resize(frame, (300, 300), dst=self._small, interpolation=cv2.INTER_LINEAR)
+        for c in range(3):
+            np.subtract(small[:, :, c], self._mean[c], out=self._blob[0, c])
         
         # Run detection
-        self.net.setInput(blob)
-        detections = self.net.forward()
+        if self._ort is not None:
+            detections = self._ort.run(None, {self._ort_input: self._blob})[0][0, 0]
+        else:
+            self.net.setInput(self._blob)
+            detections = self.net.forward()[0, 0]
+            
+            # Decide on FP16 with the first frame that actually has faces
+            # (copy first: the FP16 pass may reuse the output buffer)
+            if self._fp16_target is not None and \
+                    np.any(detections[:, 2] > self.confidence_threshold):
+                detections = detections.copy()
+                self._validate_fp16(self._blob, detections)
         
-        faces = []
+        return self._ssd_boxes(detections, w, h)
+    
+    def _ssd_boxes(self, det: np.ndarray, w: int, h: int) -> List[Tuple[int, int, int, int]]:
+        """
+        Convert SSD detection rows for one image into bounding boxes.
         
-        # Process detections
-        for i in range(detections.shape[2]):
-            confidence = detections[0, 0, i, 2]
+        Args:
+            det: (N, 7) rows of (image_id, label, confidence, x0, y0, x1, y1)
+            w: Frame width
+            h: Frame height
             
-            if confidence > self.confidence_threshold:
-                # Get bounding box coordinates
-                box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
-                (startX, startY, endX, endY) = box.astype("int")
-                
-                # Convert to (top, right, bottom, left) format
-                # to match face_recognition library
-                faces.append((startY, endX, endY, startX))
+        Returns:
+            List of (top, right, bottom, left) tuples
+        """
+        # Keep confident rows, scale all boxes at once
+        mask = det[:, 2] > self.confidence_threshold
+        boxes = (det[mask, 3:7] * np.array([w, h, w, h])).astype("int")
         
-        return faces
+        # Convert (startX, startY, endX, endY) to (top, right, bottom, left)
+        # format to match face_recognition library
+        return [tuple(box) for box in boxes[:, [1, 2, 3, 0]].tolist()]
+    
+    def _detect_yunet(self, frame: np.ndarray, w: int, h: int) -> List[Tuple[int, int, int, int]]:
+        """
+        Detect faces using YuNet (thresholding and NMS happen inside OpenCV).
+        
+        Args:
+            frame: Input frame
+            w: Frame width
+            h: Frame height
+            
+        Returns:
+            List of (top, right, bottom, left) tuples
+        """
+        self.yunet.setInputSize((w, h))
+        _, detections = self.yunet.detect(frame)
+        
+        if detections is None:
+            return []
+        
+        # Rows are (x, y, w, h, 5 landmarks, score)
+        x, y, bw, bh = detections[:, :4].astype(int).T
+        return list(zip(y.tolist(), (x + bw).tolist(), (y + bh).tolist(), x.tolist()))
     
     def _detect_haar(self, frame: np.ndarray, w: int, h: int) -> List[Tuple[int, int, int, int]]:
         """
         Detect faces using Haar cascade (fallback).
         
         Args:
-            frame: Input frame
+            frame: Input frame (BGR or single-channel grayscale)
             w: Frame width
             h: Frame height
             
         Returns:
             List of (top, right, bottom, left) tuples
         """
-        # Convert to grayscale for Haar cascade
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # Haar cost scales with pixel count, so detect on a downscaled copy
+        # and map the boxes back to full resolution
+        scale = min(1.0, self.HAAR_DETECT_WIDTH / w)
+        if scale < 1.0:
+            small = cv2.resize(
+                frame,
+                (self.HAAR_DETECT_WIDTH, max(1, int(h * scale))),
+                interpolation=cv2.INTER_AREA
+            )
+        else:
+            small = frame
         
-        # Detect faces
+        # Convert to grayscale for Haar cascade (camera may already deliver it)
+        if small.ndim == 2:
+            gray = small
+        else:
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        
+        # Detect faces (minimum size shrinks with the frame)
+        min_size = max(1, int(30 * scale))
         detected = self.cascade.detectMultiScale(
             gray,
             scaleFactor=1.1,
             minNeighbors=5,
-            minSize=(30, 30),
+            minSize=(min_size, min_size),
             flags=cv2.CASCADE_SCALE_IMAGE
         )
         
-        faces = []
-        
-        # Convert from (x, y, w, h) to (top, right, bottom, left)
-        for (x, y, w, h) in detected:
-            top = y
-            right = x + w
-            bottom = y + h
-            left = x
-            faces.append((top, right, bottom, left))
+        if len(detected) == 0:
+            return []
         
-        return faces
+        # Rescale all boxes at once, then convert from (x, y, w, h)
+        # to (top, right, bottom, left)
+        boxes = (np.asarray(detected) / scale).astype("int")
+        x, y, bw, bh = boxes.T
+        return list(zip(y.tolist(), (x + bw).tolist(), (y + bh).tolist(), x.tolist()))
     
     def draw_faces(self, frame: np.ndarray, faces: List[Tuple[int, int, int, int]], 
                    color: Tuple[int, int, int] = (0, 255, 0), 
                    thickness: int = 2,
-                   label: str = "FACE") -> np.ndarray:
+                   label: str = "FACE",
+                   inplace: bool = False) -> np.ndarray:
         """
         Draw bounding boxes on detected faces.
         
@@ -186,11 +515,13 @@ class FaceDetector:
             color: BGR color for bounding box
             thickness: Line thickness
             label: Text label to display
+            inplace: Draw directly on frame instead of a copy (only safe when
+                nothing else reads the frame afterwards)
             
         Returns:
             Frame with drawn boxes
         """
-        output = frame.copy()
+        output = frame if inplace else frame.copy()
         
         for (top, right, bottom, left) in faces:
             # Draw rectangle
@@ -220,20 +551,25 @@ class FaceDetector:
         Returns:
             Dictionary with performance metrics
         """
-        times = []
+        # Warm up: the first inference includes one-time setup costs
+        self.detect_faces(frame)
         
-        for _ in range(iterations):
-            start = time.time()
-            faces = self.detect_faces(frame)
-            elapsed = (time.time() - start) * 1000  # Convert to ms
-            times.append(elapsed)
+        times_ns = np.empty(iterations, dtype=np.int64)
+        
+        for i in range(iterations):
+            start = time.perf_counter_ns()
+            self.detect_faces(frame)
+            times_ns[i] = time.perf_counter_ns() - start
+        
+        times = times_ns / 1e6  # Convert to ms
+        avg_ms = times.mean()
         
         return {
-            'avg_ms': np.mean(times),
-            'min_ms': np.min(times),
-            'max_ms': np.max(times),
-            'std_ms': np.std(times),
-            'meets_target': np.mean(times) < 100.0
+            'avg_ms': avg_ms,
+            'min_ms': times.min(),
+            'max_ms': times.max(),
+            'std_ms': times.std(),
+            'meets_target': avg_ms < 100.0
         }
 
 
@@ -246,6 +582,9 @@ def main():
     # Initialize detector
     detector = FaceDetector(confidence_threshold=0.5)
     
+    # Leave one core free so the DNN worker doesn't starve camera capture
+    cv2.setNumThreads(max(1, (os.cpu_count() or 2) - 1))
+    
     # Open camera
     cap = cv2.VideoCapture(0)
     
@@ -256,11 +595,64 @@ def main():
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
     
+    # The cascade fallback only needs luminance: ask the camera for grayscale
+    # frames so no BGR->gray pass is needed, and undo it if the backend can't
+    if not detector.model_loaded:
+        fourcc = cap.get(cv2.CAP_PROP_FOURCC)
+        convert_rgb = cap.get(cv2.CAP_PROP_CONVERT_RGB)
+        grey = cv2.VideoWriter_fourcc(*'GREY')
+        cap.set(cv2.CAP_PROP_FOURCC, grey)
+        cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+        ret, frame = cap.read()
+        
+        # With RGB conversion off, V4L2 hands back the raw driver buffer as
+        # a (1, bytesused) Mat when GREY wasn't applied, which is also 2-D;
+        # only accept a full-size single-channel image in GREY format
+        expected_shape = (
+            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        )
+        if not ret or frame is None or frame.shape != expected_shape or \
+                int(cap.get(cv2.CAP_PROP_FOURCC)) != grey:
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, convert_rgb)
+            cap.set(cv2.CAP_PROP_FOURCC, fourcc)
+        else:
+            print("✓ Capturing grayscale frames for cascade detection")
+    
     print("✓ Camera opened")
     print("\nPress 'q' or ESC to quit\n")
     
+    # Detection runs on a worker thread fed by a single-slot queue; the
+    # display loop draws the most recent result on every new frame
+    frame_queue: queue.Queue = queue.Queue(maxsize=1)
+    stop_flag = threading.Event()
+    lock = threading.Lock()
+    results = {'faces': [], 'detection_ms': 0.0, 'count': 0, 'total_ms': 0.0, 'empty_streak': 0}
+    
+    def detection_worker():
+        while not stop_flag.is_set():
+            try:
+                frame = frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            start = time.time()
+            faces = detector.detect_faces_cached(frame)
+            detection_ms = (time.time() - start) * 1000
+            
+            with lock:
+                results['faces'] = faces
+                results['detection_ms'] = detection_ms
+                results['count'] += 1
+                results['total_ms'] += detection_ms
+                results['empty_streak'] = 0 if faces else results['empty_streak'] + 1
+    
+    worker = threading.Thread(target=detection_worker, name="FaceDetection", daemon=True)
+    worker.start()
+    
     frame_count = 0
-    total_time = 0
+    loop_start = time.time()
+    overlay = None
     
     cv2.namedWindow('Face Detection Test', cv2.WINDOW_NORMAL)
     
@@ -270,16 +662,34 @@ def main():
             if not ret:
                 break
             
-            # Detect faces
-            start = time.time()
-            faces = detector.detect_faces(frame)
-            detection_time = (time.time() - start) * 1000  # ms
+            with lock:
+                faces = results['faces']
+                detection_time = results['detection_ms']
+                empty_streak = results['empty_streak']
             
-            # Draw faces
-            output = detector.draw_faces(frame, faces)
+            # After 30 empty detections in a row only every 3rd frame is
+            # checked; the first face found restores per-frame detection
+            if empty_streak <= 30 or frame_count % 3 == 0:
+                # Hand the frame to the worker, replacing any frame it hasn't taken yet
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    frame_queue.put_nowait(frame)
+                except queue.Full:
+                    pass
+            
+            # Draw faces on a reused overlay buffer: the worker may still be
+            # reading this frame, and a fresh copy per frame is pure churn
+            if overlay is None or overlay.shape != frame.shape:
+                overlay = np.empty_like(frame)
+            np.copyto(overlay, frame)
+            output = detector.draw_faces(overlay, faces, inplace=True)
             
             # Add performance overlay
-            fps = frame_count / total_time if total_time > 0 else 0
+            elapsed = time.time() - loop_start
+            fps = frame_count / elapsed if elapsed > 0 else 0
             cv2.putText(
                 output,
                 f"Faces: {len(faces)}  |  Detection: {detection_time:.1f}ms  |  FPS: {fps:.1f}",
@@ -295,7 +705,6 @@ def main():
             
             # Update stats
             frame_count += 1
-            total_time += time.time() - start
             
             # Check for quit
             key = cv2.waitKey(1) & 0xFF
@@ -306,15 +715,19 @@ def main():
         print("\nInterrupted by user")
     
     finally:
+        stop_flag.set()
+        worker.join(timeout=1.0)
         cap.release()
         cv2.destroyAllWindows()
         
         # Print summary
-        avg_detection_time = (total_time / frame_count * 1000) if frame_count > 0 else 0
-        print(f"\nProcessed {frame_count} frames")
+        with lock:
+            detections = results['count']
+            total_ms = results['total_ms']
+        avg_detection_time = (total_ms / detections) if detections > 0 else 0
+        print(f"\nProcessed {frame_count} frames ({detections} detection passes)")
         print(f"Average detection time: {avg_detection_time:.1f}ms")
         print(f"Target met (< 100ms): {'✓' if avg_detection_time < 100 else '✗'}")
 
-
 if __name__ == "__main__":
     main()
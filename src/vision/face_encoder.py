@@ -182,6 +182,10 @@ class FaceEncoder:
         """
         Encode multiple face images in batch.
         
+        All faces go through the network in one forward pass; if the
+        model rejects a batched input, falls back to encoding them one
+        at a time.
+        
         Args:
             face_images: List of face images
             normalize: Whether to L2-normalize encodings
@@ -189,13 +193,95 @@ class FaceEncoder:
         Returns:
             List of face encodings (None for failed encodings)
         """
-        encodings = []
-        for face_image in face_images:
-            encoding = self.encode_face(face_image, normalize=normalize)
-            encodings.append(encoding)
+        encodings: list[Optional[np.ndarray]] = [None] * len(face_images)
+        valid = []
+        for i, face_image in enumerate(face_images):
+            if face_image is None or face_image.size == 0:
+                logger.warning("Cannot encode empty or None image")
+            elif face_image.ndim == 3 and face_image.shape[2] == 3 and face_image.dtype == np.uint8:
+                valid.append(i)
+            else:
+                # cv2.resize only fills the batch buffer row for 3-channel
+                # uint8 input (otherwise it silently allocates a new array),
+                # so other images take the single-image path
+                encodings[i] = self.encode_face(face_image, normalize=normalize)
+        if not valid:
+            return encodings
+        
+        try:
+            # Resize every face straight into one preallocated (K, 112, 112, 3)
+            # buffer, then turn that into a single (K, 3, 112, 112) blob
+            width, height = self.input_size
+            faces = np.empty((len(valid), height, width, 3), dtype=np.uint8)
+            for k, i in enumerate(valid):
+                cv2.resize(face_images[i], self.input_size, dst=faces[k])
+            blob = cv2.dnn.blobFromImages(
+                faces,
+                scalefactor=1.0 / 255.0,
+                size=self.input_size,
+                mean=(0, 0, 0),
+                swapRB=True,  # BGR to RGB
+                crop=False
+            )
+            
+            # Single inference for the whole batch
+            self.net.setInput(blob)
+            batch = self.net.forward().reshape(len(valid), -1)
+        except Exception as e:
+            logger.debug(f"Batched inference unavailable, encoding faces one by one: {e}")
+            return [self.encode_face(face_image, normalize=normalize) for face_image in face_images]
+        
+        # L2 normalization for cosine similarity
+        if normalize:
+            norms = np.linalg.norm(batch, axis=1, keepdims=True)
+            batch = batch / np.where(norms > 0, norms, 1.0)
+        
+        for row, i in enumerate(valid):
+            encodings[i] = batch[row]
         
         return encodings
     
+    def encode_faces_from_frame(
+        self,
+        frame: np.ndarray,
+        face_locations: list[Tuple[int, int, int, int]],
+        normalize: bool = True
+    ) -> list[Optional[np.ndarray]]:
+        """
+        Encode every face location in a frame with one batched inference.
+        
+        Args:
+            frame: Full camera frame (BGR format)
+            face_locations: Face bounding boxes as (top, right, bottom, left)
+            normalize: Whether to L2-normalize the encodings
+            
+        Returns:
+            List of face encodings in the order of face_locations
+            (None for invalid locations or failed encodings)
+        """
+        if frame is None or frame.size == 0:
+            logger.warning("Cannot encode from empty or None frame")
+            return [None] * len(face_locations)
+        
+        height, width = frame.shape[:2]
+        face_images = []
+        for face_location in face_locations:
+            top, right, bottom, left = face_location
+            
+            # Validate bounds
+            top = max(0, top)
+            left = max(0, left)
+            bottom = min(height, bottom)
+            right = min(width, right)
+            
+            if bottom <= top or right <= left:
+                logger.warning(f"Invalid face location: {face_location}")
+                face_images.append(None)
+            else:
+                face_images.append(frame[top:bottom, left:right])
+        
+        return self.batch_encode_faces(face_images, normalize=normalize)
+    
     def get_model_info(self) -> dict:
         """
         Get information about the loaded model.
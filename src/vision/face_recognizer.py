@@ -121,22 +121,14 @@ class FaceRecognizer:
         if self.database.is_empty():
             return ("unknown", 0.0)
         
-        # Get all known encodings
-        all_encodings = self.database.get_all_encodings()
+        # Compare with every known face in one matrix-vector product
+        # Since encodings are L2-normalized, cosine similarity = dot product
+        best_match_name, best_match_score = self.database.match(encoding)[0]
         
-        best_match_name = "unknown"
-        best_match_score = 0.0
-        
-        # Compare with each known face
-        for name, known_encoding in all_encodings:
-            # Calculate cosine similarity
-            # Since encodings are L2-normalized, cosine similarity = dot product
-            similarity = np.dot(encoding, known_encoding)
-            
-            # Track best match
-            if similarity > best_match_score:
-                best_match_score = similarity
-                best_match_name = name
+        # Only positive similarities count as a match candidate
+        if not best_match_score > 0.0:
+            best_match_name = "unknown"
+            best_match_score = 0.0
         
         # Check if best match exceeds threshold
         if best_match_score >= self.threshold:
@@ -177,36 +169,48 @@ class FaceRecognizer:
         Returns:
             List of (name, confidence) tuples, same order as input
         """
+        names, scores = self.recognize_faces_arrays(encodings)
+        return list(zip(names, scores.tolist()))
+    
+    def recognize_faces_arrays(self, encodings: List[np.ndarray]) -> Tuple[List[str], np.ndarray]:
+        """
+        Recognize multiple faces, returning names and scores side by side.
+        
+        Same matching as recognize_faces_vectorized(), without packing the
+        results into per-face tuples.
+        
+        Args:
+            encodings: List of face encodings (or an (N, 128) matrix)
+            
+        Returns:
+            Tuple of (names, scores): names[i] is the match or "unknown" and
+            scores is an (N,) float64 array of best similarities
+        """
         if len(encodings) == 0:
-            return []
+            return [], np.empty(0, dtype=np.float64)
         
         if self.database.is_empty():
-            return [("unknown", 0.0) for _ in encodings]
+            return ["unknown"] * len(encodings), np.zeros(len(encodings), dtype=np.float64)
         
         # Stack encodings into matrix
-        unknown_matrix = np.array(encodings)  # Shape: (n_unknown, 128)
+        unknown_matrix = np.asarray(encodings)  # Shape: (n_unknown, 128)
         
-        # Get all known encodings
-        all_encodings = self.database.get_all_encodings()
-        names = [name for name, _ in all_encodings]
-        known_encodings = [enc for _, enc in all_encodings]
-        known_matrix = np.array(known_encodings)  # Shape: (n_known, 128)
+        # Get all known encodings (cached matrix, shape: (n_known, 128))
+        known_names, known_matrix = self.database.get_encoding_matrix()
         
         # Compute all similarities at once: (n_unknown, n_known)
         similarities = np.dot(unknown_matrix, known_matrix.T)
         
-        # Find best match for each unknown face
-        results = []
-        for i in range(len(encodings)):
-            best_idx = np.argmax(similarities[i])
-            best_score = similarities[i, best_idx]
-            
-            if best_score >= self.threshold:
-                results.append((names[best_idx], float(best_score)))
-            else:
-                results.append(("unknown", float(best_score)))
+        # Best match for every unknown face at once
+        best_idx = similarities.argmax(axis=1)
+        scores = similarities[np.arange(len(best_idx)), best_idx].astype(np.float64)
+        matched = scores >= self.threshold
         
-        return results
+        names = [
+            known_names[idx] if ok else "unknown"
+            for idx, ok in zip(best_idx.tolist(), matched.tolist())
+        ]
+        return names, scores
     
     def recognize_from_frame(
         self, 
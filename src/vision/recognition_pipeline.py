@@ -10,13 +10,14 @@ pipeline that achieves ≥5 FPS real-time recognition.
 
 import cv2
 import numpy as np
+import queue
+import threading
 import time
 from typing import List, Tuple, Optional, Dict, Any, Callable
 from pathlib import Path
-from collections import deque
 import logging
 
-from .camera_interface import CameraInterface
+from .camera_interface import CameraInterface, LatestFrameQueue
 from .face_detector import FaceDetector
 from .face_encoder import FaceEncoder
 from .face_database import FaceDatabase
@@ -35,6 +36,66 @@ except ImportError:
     logger.warning("Config not available, using default pipeline settings")
 
 
+class _RollingMean:
+    """
+    Fixed-size rolling window with an O(1) mean.
+    
+    Samples live in a NumPy ring buffer and a running sum is updated on
+    every add, so neither appending nor averaging walks the window.
+    """
+    
+    def __init__(self, size: int):
+        self._ring = np.zeros(size, dtype=np.float64)
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+    
+    def add(self, value: float):
+        """Add a sample, evicting the oldest one once the window is full."""
+        self._sum += value - self._ring[self._idx]
+        self._ring[self._idx] = value
+        self._idx = (self._idx + 1) % len(self._ring)
+        self._count = min(self._count + 1, len(self._ring))
+    
+    def mean(self) -> float:
+        """Mean of the samples in the window (0.0 if empty)."""
+        return float(self._sum / self._count) if self._count else 0.0
+    
+    def extend(self, values: np.ndarray):
+        """Add several samples with vectorized ring-buffer writes."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        n = len(values)
+        size = len(self._ring)
+        
+        if n >= size:
+            # Only the newest window-full survives
+            self._ring[:] = values[-size:]
+            self._idx = 0
+            self._count = size
+            self._sum = float(self._ring.sum())
+            return
+        
+        # Write in at most two slices: up to the end of the ring, then wrap
+        first = min(n, size - self._idx)
+        rest = n - first
+        self._sum += float(
+            values.sum()
+            - self._ring[self._idx:self._idx + first].sum()
+            - self._ring[:rest].sum()
+        )
+        self._ring[self._idx:self._idx + first] = values[:first]
+        self._ring[:rest] = values[first:]
+        self._idx = (self._idx + n) % size
+        self._count = min(self._count + n, size)
+    
+    def values(self) -> np.ndarray:
+        """Samples currently in the window (unordered)."""
+        return self._ring[:self._count]
+    
+    def __len__(self) -> int:
+        return self._count
+
+
 class RecognitionPipeline:
     """
     Real-time face recognition pipeline.
@@ -48,7 +109,7 @@ class RecognitionPipeline:
         encoder: FaceEncoder for generating face embeddings
         database: FaceDatabase with known faces
         recognizer: FaceRecognizer for matching faces
-        frame_count: Total frames processed
+        frame_count: Total frames captured (processed or skipped)
         fps: Current frames per second
         last_results: Most recent recognition results
     """
@@ -64,7 +125,9 @@ class RecognitionPipeline:
         process_every_n_frames: Optional[int] = None,
         enable_events: Optional[bool] = None,
         event_debounce_frames: Optional[int] = None,
-        event_departed_frames: Optional[int] = None
+        event_departed_frames: Optional[int] = None,
+        detection_scale: Optional[float] = None,
+        min_face_size: Optional[int] = None
     ):
         """
         Initialize recognition pipeline.
@@ -80,6 +143,8 @@ class RecognitionPipeline:
             enable_events: Enable event system (default from config or False)
             event_debounce_frames: Frames before event trigger (default from config or 3)
             event_departed_frames: Absent frames before DEPARTED (default from config or 3)
+            detection_scale: Frame scale used for detection only (default from config or 0.5)
+            min_face_size: Smallest face side in pixels worth encoding (default from config or 80)
             
         Example:
             >>> pipeline = RecognitionPipeline(enable_events=True)
@@ -101,6 +166,10 @@ class RecognitionPipeline:
                     event_debounce_frames = int(config.events.debounce_seconds * config.camera.fps)
                 if event_departed_frames is None:
                     event_departed_frames = int(config.events.departed_threshold_seconds * config.camera.fps)
+                if detection_scale is None:
+                    detection_scale = config.face_detection.detection_scale
+                if min_face_size is None:
+                    min_face_size = config.face_detection.min_face_size
                 logger.info("Loaded pipeline settings from config")
             except Exception as e:
                 logger.warning(f"Failed to load pipeline config: {e}")
@@ -116,6 +185,10 @@ class RecognitionPipeline:
             event_debounce_frames = 3
         if event_departed_frames is None:
             event_departed_frames = 3
+        if detection_scale is None:
+            detection_scale = 0.5
+        if min_face_size is None:
+            min_face_size = 80
         
         # Initialize components
         self.camera = camera if camera is not None else CameraInterface()
@@ -143,22 +216,24 @@ class RecognitionPipeline:
         
         # Pipeline configuration
         self.process_every_n_frames = max(1, process_every_n_frames)
+        self.detection_scale = min(1.0, detection_scale) if detection_scale > 0 else 1.0
+        self.min_face_size = max(0, int(min_face_size))
         
         # Performance tracking
         self.frame_count = 0
         self.processed_frame_count = 0
         self.fps = 0.0
         self.processing_time_ms = 0.0
-        self.last_fps_update = time.time()
+        self.last_fps_update_ns = time.perf_counter_ns()  # Monotonic, for FPS
         self.fps_frame_count = 0
         
         # Performance metrics (Story 4.2)
         self.metrics = {
             'frames_processed': 0,
             'total_recognition_time': 0.0,
-            'recognition_times': deque(maxlen=100),  # Rolling window of last 100
-            'fps_samples': deque(maxlen=30),  # Last 30 FPS measurements
-            'confidence_scores': deque(maxlen=100),  # Last 100 confidence scores
+            'recognition_times': _RollingMean(100),  # Rolling window of last 100
+            'fps_samples': _RollingMean(30),  # Last 30 FPS measurements
+            'confidence_scores': _RollingMean(100),  # Last 100 confidence scores
         }
         self.start_time = time.time()
         self.last_summary_time = time.time()
@@ -166,9 +241,27 @@ class RecognitionPipeline:
         # Results tracking
         self.last_results: List[Tuple[str, float, Tuple[int, int, int, int]]] = []
         
+        # Reused draw_results() output buffer (reallocated if the frame shape changes)
+        self._draw_buf: Optional[np.ndarray] = None
+        
+        # Reused downscaled frame for detection (see detection_scale)
+        self._detect_buf: Optional[np.ndarray] = None
+        
+        # Reused grayscale frame for detectors that accept single-channel input
+        self._gray_buf: Optional[np.ndarray] = None
+        
+        # draw_results() label sizes keyed by (text, font, font scale, thickness)
+        self._label_size_cache: Dict[Tuple[str, int, float, int], Tuple[int, int]] = {}
+        
+        # Guards last_results and metrics; run_live() processes frames on a
+        # worker thread while the display loop reads them
+        self._state_lock = threading.Lock()
+        
         logger.info(f"RecognitionPipeline initialized")
         logger.info(f"  Threshold: {recognition_threshold}")
         logger.info(f"  Process every {process_every_n_frames} frame(s)")
+        logger.info(f"  Detection scale: {self.detection_scale}")
+        logger.info(f"  Min face size: {self.min_face_size}px")
         logger.info(f"  Database: {self.database.size()} known faces")
     
     def load_database(self, filepath: str) -> bool:
@@ -189,7 +282,8 @@ class RecognitionPipeline:
     def process_frame(
         self,
         frame: np.ndarray,
-        force_process: bool = False
+        force_process: bool = False,
+        frame_number: Optional[int] = None
     ) -> List[Tuple[str, float, Tuple[int, int, int, int]]]:
         """
         Process a single frame through the recognition pipeline.
@@ -199,6 +293,8 @@ class RecognitionPipeline:
         Args:
             frame: Input frame (BGR format)
             force_process: If True, process even if frame should be skipped
+            frame_number: Capture index of the frame, for callers that skip
+                frames before they get here (default: count this call)
             
         Returns:
             List of (name, confidence, bbox) tuples
@@ -210,122 +306,164 @@ class RecognitionPipeline:
             >>> for name, conf, (t, r, b, l) in results:
             >>>     print(f"{name}: {conf:.2f} at ({l},{t})-({r},{b})")
         """
-        self.frame_count += 1
+        if frame_number is None:
+            self.frame_count += 1
+        else:
+            self.frame_count = frame_number
         
         # Frame skipping for performance
         if not force_process and self.frame_count % self.process_every_n_frames != 0:
             return self.last_results
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Increment processed frame count
         self.processed_frame_count += 1
         
-        # Step 1: Detect faces
-        face_locations = self.detector.detect_faces(frame)
+        # Step 1: Detect faces on a downscaled copy, then map the boxes back
+        # to full resolution (detection cost scales with pixel count)
+        scale = self.detection_scale
+        small = self._downscale_for_detection(frame, scale) if scale < 1.0 else frame
+        
+        # The cascade detector only needs luminance: hand it a single-channel
+        # frame converted into a reused buffer
+        if small.ndim == 3 and getattr(self.detector, 'accepts_grayscale', False):
+            small = self._grayscale_for_detection(small)
+        
+        locs = np.asarray(self.detector.detect_faces(small), dtype=np.int32).reshape(-1, 4)
+        if scale < 1.0:
+            locs = (locs / scale).astype(np.int32)
+        
+        # Drop faces too small to recognize reliably before paying for encoding
+        if self.min_face_size > 0 and len(locs):
+            heights = locs[:, 2] - locs[:, 0]
+            widths = locs[:, 1] - locs[:, 3]
+            locs = locs[(heights >= self.min_face_size) & (widths >= self.min_face_size)]
+        face_locations = [tuple(loc) for loc in locs.tolist()]
         
         if len(face_locations) == 0:
-            self.last_results = []
-            self._update_performance_metrics(start_time, [])
+            with self._state_lock:
+                self.last_results = []
+            self._update_performance_metrics(start_ns)
             return []
         
-        # Step 2: Extract and encode faces
-        encodings = []
-        for top, right, bottom, left in face_locations:
-            # Extract face region
-            face_img = frame[top:bottom, left:right]
-            
-            # Encode face
-            encoding = self.encoder.encode_face(face_img, normalize=True)
+        # Step 2: Extract and encode all faces in one batched inference
+        encodings = np.zeros((len(face_locations), 128), dtype=np.float32)
+        for i, encoding in enumerate(
+            self.encoder.encode_faces_from_frame(frame, face_locations, normalize=True)
+        ):
+            # Failed encodings keep the zero vector as placeholder
             if encoding is not None:
-                encodings.append(encoding)
-            else:
-                # Encoding failed, use zero vector as placeholder
-                encodings.append(np.zeros(128, dtype=np.float32))
+                encodings[i] = encoding
         
         # Step 3: Recognize all faces (vectorized for performance)
-        recognition_results = self.recognizer.recognize_faces_vectorized(encodings)
+        names, confidences = self.recognizer.recognize_faces_arrays(encodings)
         
         # Step 4: Combine results
-        results = []
-        for (name, confidence), bbox in zip(recognition_results, face_locations):
-            results.append((name, confidence, bbox))
+        results = list(zip(names, confidences.tolist(), face_locations))
         
-        self.last_results = results
+        with self._state_lock:
+            self.last_results = results
         
         # Generate events if event system enabled (Story 2.5)
         if self.event_manager is not None:
             self.event_manager.process_recognition_results(results, frame_number=self.frame_count)
         
         # Update performance metrics
-        self._update_performance_metrics(start_time, results)
+        self._update_performance_metrics(start_ns, confidences)
         
         # Print periodic performance summary (Story 4.2)
         if time.time() - self.last_summary_time >= 60:
             self._print_performance_summary()
             self.last_summary_time = time.time()
         
-        # Log recognition events
-        if results:
+        # Log recognition events (skip the per-face formatting unless DEBUG is on)
+        if results and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Frame {self.frame_count}: {len(results)} face(s), "
-                f"{self.processing_time_ms:.1f}ms, {self.fps:.1f} FPS"
+                "Frame %d: %d face(s), %.1fms, %.1f FPS",
+                self.frame_count, len(results), self.processing_time_ms, self.fps
             )
             for name, conf, _ in results:
-                logger.debug(f"  - {name}: {conf:.3f}")
+                logger.debug("  - %s: %.3f", name, conf)
         
         return results
     
-    def _update_performance_metrics(self, start_time: float, results: Optional[List] = None):
+    def _downscale_for_detection(self, frame: np.ndarray, scale: float) -> np.ndarray:
         """
-        Update FPS and processing time metrics (Story 4.2).
+        Resize frame by scale into a buffer reused across frames.
         
         Args:
-            start_time: Processing start timestamp
-            results: Recognition results (for confidence tracking)
+            frame: Input frame
+            scale: Resize factor (< 1.0)
+            
+        Returns:
+            Downscaled frame (overwritten by the next call)
         """
-        # Processing time for this frame
-        self.processing_time_ms = (time.time() - start_time) * 1000
+        # Same output size OpenCV derives from fx/fy (rounded to nearest)
+        h, w = frame.shape[:2]
+        shape = (round(h * scale), round(w * scale)) + frame.shape[2:]
         
-        # Story 4.2: Track metrics
-        self.metrics['frames_processed'] += 1
-        self.metrics['total_recognition_time'] += self.processing_time_ms
-        self.metrics['recognition_times'].append(self.processing_time_ms)
+        if self._detect_buf is None or self._detect_buf.shape != shape or \
+                self._detect_buf.dtype != frame.dtype:
+            self._detect_buf = np.empty(shape, dtype=frame.dtype)
         
-        # Track confidence scores
-        if results:
-            for name, confidence, _ in results:
-                self.metrics['confidence_scores'].append(confidence)
-        
-        # FPS calculation (update every second)
-        self.fps_frame_count += 1
-        elapsed = time.time() - self.last_fps_update
-        if elapsed >= 1.0:
-            self.fps = self.fps_frame_count / elapsed
-            self.metrics['fps_samples'].append(self.fps)
-            self.fps_frame_count = 0
-            self.last_fps_update = time.time()
+        return cv2.resize(
+            frame, None, dst=self._detect_buf, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+        )
+    
+    def _grayscale_for_detection(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Convert a BGR frame to grayscale into a buffer reused across frames.
+        
+        Args:
+            frame: BGR frame
+            
+        Returns:
+            Single-channel frame (overwritten by the next call)
+        """
+        if self._gray_buf is None or self._gray_buf.shape != frame.shape[:2]:
+            self._gray_buf = np.empty(frame.shape[:2], dtype=np.uint8)
+        
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+    
+    def _update_performance_metrics(self, start_ns: int, confidences: Optional[np.ndarray] = None):
+        """
+        Update FPS and processing time metrics (Story 4.2).
+        
+        Args:
+            start_ns: Processing start from time.perf_counter_ns()
+            confidences: Recognition confidences of this frame's faces
+        """
+        # Processing time for this frame
+        now_ns = time.perf_counter_ns()
+        self.processing_time_ms = (now_ns - start_ns) * 1e-6
+        
+        with self._state_lock:
+            # Story 4.2: Track metrics
+            self.metrics['frames_processed'] += 1
+            self.metrics['total_recognition_time'] += self.processing_time_ms
+            self.metrics['recognition_times'].add(self.processing_time_ms)
+            
+            # Track confidence scores
+            if confidences is not None and len(confidences):
+                self.metrics['confidence_scores'].extend(confidences)
+            
+            # FPS calculation (update every second)
+            self.fps_frame_count += 1
+            elapsed = (now_ns - self.last_fps_update_ns) * 1e-9
+            if elapsed >= 1.0:
+                self.fps = self.fps_frame_count / elapsed
+                self.metrics['fps_samples'].add(self.fps)
+                self.fps_frame_count = 0
+                self.last_fps_update_ns = now_ns
     
     def _print_performance_summary(self):
         """Print performance metrics summary every 60 seconds (Story 4.2)."""
         # Calculate averages
-        avg_recognition_time = (
-            sum(self.metrics['recognition_times']) / 
-            len(self.metrics['recognition_times'])
-            if self.metrics['recognition_times'] else 0
-        )
-        
-        avg_fps = (
-            sum(self.metrics['fps_samples']) / 
-            len(self.metrics['fps_samples'])
-            if self.metrics['fps_samples'] else 0
-        )
-        
-        avg_confidence = (
-            sum(self.metrics['confidence_scores']) / 
-            len(self.metrics['confidence_scores'])
-            if self.metrics['confidence_scores'] else 0
-        )
+        with self._state_lock:
+            avg_recognition_time = self.metrics['recognition_times'].mean()
+            avg_fps = self.metrics['fps_samples'].mean()
+            avg_confidence = self.metrics['confidence_scores'].mean()
         
         uptime = time.time() - self.start_time
         
@@ -365,26 +503,47 @@ class RecognitionPipeline:
         Draw recognition results on frame.
         
         Args:
-            frame: Input frame to draw on (will be copied)
+            frame: Input frame to draw on (copied, not modified)
             results: Recognition results (uses last_results if None)
             show_fps: If True, display FPS counter
             
         Returns:
-            Frame with visual overlays
+            Frame with visual overlays. The buffer is reused by the next
+            call, so copy it if it must outlive that call.
             
         Example:
             >>> results = pipeline.process_frame(frame)
             >>> annotated = pipeline.draw_results(frame, results)
             >>> cv2.imshow("Recognition", annotated)
         """
-        # Copy frame to avoid modifying original
-        output = frame.copy()
+        # Copy frame into the reused buffer to avoid modifying original
+        if self._draw_buf is None or self._draw_buf.shape != frame.shape or \
+                self._draw_buf.dtype != frame.dtype:
+            self._draw_buf = np.empty_like(frame)
+        np.copyto(self._draw_buf, frame)
+        output = self._draw_buf
         
         # Use last results if not provided
         if results is None:
             results = self.last_results
         
-        # Draw bounding boxes and labels
+        # Draw all bounding boxes with one polylines call per color
+        if results:
+            boxes = np.array([bbox for _, _, bbox in results], dtype=np.int32)
+            top, right, bottom, left = boxes.T
+            corners = np.stack([
+                np.stack([left, top], axis=1),
+                np.stack([right, top], axis=1),
+                np.stack([right, bottom], axis=1),
+                np.stack([left, bottom], axis=1),
+            ], axis=1)  # Shape: (N, 4, 2)
+            unknown = np.array([name == "unknown" for name, _, _ in results])
+            if unknown.any():
+                cv2.polylines(output, list(corners[unknown]), True, (0, 0, 255), 2)
+            if not unknown.all():
+                cv2.polylines(output, list(corners[~unknown]), True, (0, 255, 0), 2)
+        
+        # Draw labels
         for name, confidence, (top, right, bottom, left) in results:
             # Choose color based on recognition
             if name == "unknown":
@@ -394,9 +553,6 @@ class RecognitionPipeline:
                 color = (0, 255, 0)  # Green for recognized
                 label_color = (0, 0, 0)  # Black text
             
-            # Draw bounding box
-            cv2.rectangle(output, (left, top), (right, bottom), color, 2)
-            
             # Draw label background
             label = f"{name}"
             conf_label = f"{confidence:.2f}"
@@ -405,8 +561,8 @@ class RecognitionPipeline:
             font = cv2.FONT_HERSHEY_SIMPLEX
             font_scale = 0.6
             thickness = 2
-            (label_w, label_h), _ = cv2.getTextSize(label, font, font_scale, thickness)
-            (conf_w, conf_h), _ = cv2.getTextSize(conf_label, font, font_scale - 0.1, thickness)
+            label_w, label_h = self._label_dims(label, font, font_scale, thickness)
+            conf_w, conf_h = self._label_dims(conf_label, font, font_scale - 0.1, thickness)
             
             # Draw label background rectangle
             label_top = max(top - label_h - conf_h - 10, 0)
@@ -446,10 +602,10 @@ class RecognitionPipeline:
             faces_text = f"Faces: {len(results)}"
             time_text = f"Time: {self.processing_time_ms:.1f}ms"
             
-            # Draw semi-transparent background
-            overlay = output.copy()
-            cv2.rectangle(overlay, (10, 10), (300, 90), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.6, output, 0.4, 0, output)
+            # Draw semi-transparent background: blending a black box at 60%
+            # only darkens the pixels under it, so touch just that region
+            box = output[10:91, 10:301]
+            box[...] = cv2.addWeighted(box, 0.4, box, 0.0, 0)
             
             # Draw text
             font = cv2.FONT_HERSHEY_SIMPLEX
@@ -459,6 +615,20 @@ class RecognitionPipeline:
         
         return output
     
+    def _label_dims(self, label: str, font: int, font_scale: float, thickness: int) -> Tuple[int, int]:
+        """
+        Get the (width, height) of a text label, cached per label.
+        
+        Names and 2-decimal confidence strings repeat every frame, so each
+        size is measured with cv2.getTextSize only once.
+        """
+        key = (label, font, font_scale, thickness)
+        size = self._label_size_cache.get(key)
+        if size is None:
+            size = cv2.getTextSize(label, font, font_scale, thickness)[0]
+            self._label_size_cache[key] = size
+        return size
+    
     # Event System Methods (Story 2.5)
     
     def add_event_callback(
@@ -541,6 +711,16 @@ class RecognitionPipeline:
         """
         Run live recognition from camera with display.
         
+        Capture, recognition and display run as three pipelined stages: a
+        capture thread reads frames, a worker thread runs process_frame(),
+        and this thread only draws and shows results. Stages are linked by
+        small queues that drop the oldest item when full, so a slow stage
+        never makes the display fall behind the camera.
+        
+        Frame skipping (process_every_n_frames) is decided in the capture
+        thread: skipped frames go straight to the display with the latest
+        results and never reach the worker.
+        
         Args:
             show_overlay: If True, show visual overlay
             window_name: Name of display window
@@ -560,31 +740,53 @@ class RecognitionPipeline:
         logger.info(f"Controls: 'q'=quit, 's'=snapshot, 'd'=toggle debug, space=pause")
         
         debug_overlay = show_overlay
-        paused = False
         snapshot_count = 0
+        display_frame = None
+        
+        frame_queue = LatestFrameQueue()
+        result_queue: queue.Queue = queue.Queue(maxsize=2)
+        stop_flag = threading.Event()
+        paused = threading.Event()
+        
+        threads = [
+            threading.Thread(
+                target=self._capture_loop,
+                args=(frame_queue, result_queue, stop_flag, paused),
+                name="PipelineCapture",
+                daemon=True
+            ),
+            threading.Thread(
+                target=self._process_loop,
+                args=(frame_queue, result_queue, stop_flag),
+                name="PipelineWorker",
+                daemon=True
+            ),
+        ]
+        for thread in threads:
+            thread.start()
         
         try:
             while True:
-                # Capture frame
-                ret, frame = self.camera.read_frame()
-                if not ret:
-                    logger.error("Failed to read frame from camera")
-                    break
-                
-                # Process frame (unless paused)
-                if not paused:
-                    results = self.process_frame(frame)
-                else:
-                    results = self.last_results
+                try:
+                    item = result_queue.get(timeout=0.01)
+                except queue.Empty:
+                    item = False
                 
-                # Draw overlay if enabled
-                if debug_overlay:
-                    display_frame = self.draw_results(frame, results)
-                else:
-                    display_frame = frame
+                if item is None:
+                    # Capture stage stopped (camera read failed)
+                    break
                 
-                # Display frame
-                cv2.imshow(window_name, display_frame)
+                if item is not False:
+                    frame, results = item
+                    
+                    # Draw overlay if enabled
+                    if debug_overlay:
+                        display_frame = self.draw_results(frame, results)
+                    else:
+                        display_frame = frame
+                    
+                    # Display frame
+                    cv2.imshow(window_name, display_frame)
                 
                 # Handle keyboard input
                 key = cv2.waitKey(1) & 0xFF
@@ -592,7 +794,7 @@ class RecognitionPipeline:
                 if key == ord('q'):
                     logger.info("Quit requested")
                     break
-                elif key == ord('s'):
+                elif key == ord('s') and display_frame is not None:
                     # Save snapshot
                     snapshot_count += 1
                     filename = f"snapshot_{snapshot_count:03d}.jpg"
@@ -604,28 +806,118 @@ class RecognitionPipeline:
                     logger.info(f"Debug overlay: {'ON' if debug_overlay else 'OFF'}")
                 elif key == ord(' '):
                     # Pause/resume
-                    paused = not paused
-                    logger.info(f"{'PAUSED' if paused else 'RESUMED'}")
+                    if paused.is_set():
+                        paused.clear()
+                    else:
+                        paused.set()
+                    logger.info(f"{'PAUSED' if paused.is_set() else 'RESUMED'}")
         
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
         
         finally:
             # Cleanup
+            stop_flag.set()
+            for thread in threads:
+                thread.join(timeout=1.0)
             cv2.destroyAllWindows()
             logger.info(f"Processed {self.processed_frame_count} frames")
             logger.info(f"Average FPS: {self.fps:.1f}")
     
+    @staticmethod
+    def _put_latest(q: queue.Queue, item: Any):
+        """Put item on a bounded queue, dropping the oldest entry if it is full."""
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _capture_loop(
+        self,
+        frame_queue: LatestFrameQueue,
+        result_queue: queue.Queue,
+        stop_flag: threading.Event,
+        paused: threading.Event
+    ):
+        """
+        Capture stage of run_live(): read camera frames and route them.
+        
+        Every Nth frame goes to the worker through frame_queue, paired
+        with its capture index so frame_count keeps counting skipped
+        frames. Skipped frames (and all frames while paused) go straight to result_queue
+        with the latest results. When frames are skipped every frame is
+        displayed from here, in capture order, and the worker only
+        refreshes last_results.
+        """
+        n = self.process_every_n_frames
+        captured = 0
+        
+        while not stop_flag.is_set():
+            ret, frame = self.camera.read_frame()
+            if not ret:
+                logger.error("Failed to read frame from camera")
+                break
+            
+            captured += 1
+            recognize = captured % n == 0 and not paused.is_set()
+            if recognize:
+                frame_queue.put_latest((captured, frame))
+            
+            if not recognize or n > 1:
+                with self._state_lock:
+                    results = self.last_results
+                self._put_latest(result_queue, (frame, results))
+        
+        # Tell the downstream stages that no more frames are coming
+        frame_queue.close()
+        logger.debug(f"Capture stopped ({frame_queue.dropped_frames} stale frames dropped)")
+    
+    def _process_loop(
+        self,
+        frame_queue: LatestFrameQueue,
+        result_queue: queue.Queue,
+        stop_flag: threading.Event
+    ):
+        """Recognition stage of run_live(): process frames into result_queue."""
+        # With frame skipping the capture stage already displays every frame
+        display = self.process_every_n_frames == 1
+        
+        while not stop_flag.is_set():
+            item = frame_queue.poll_latest_frame(timeout=0.1)
+            
+            if item is None:
+                if frame_queue.closed:
+                    self._put_latest(result_queue, None)
+                    return
+                continue
+            
+            # The capture stage already applied frame skipping
+            captured, frame = item
+            results = self.process_frame(frame, force_process=True, frame_number=captured)
+            
+            if display:
+                self._put_latest(result_queue, (frame, results))
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get pipeline statistics."""
+        with self._state_lock:
+            last_results_count = len(self.last_results)
+        
         return {
             "frame_count": self.frame_count,
             "processed_frame_count": self.processed_frame_count,
             "fps": self.fps,
             "processing_time_ms": self.processing_time_ms,
             "database_size": self.database.size(),
-            "last_results_count": len(self.last_results),
-            "process_every_n_frames": self.process_every_n_frames
+            "last_results_count": last_results_count,
+            "process_every_n_frames": self.process_every_n_frames,
+            "detection_scale": self.detection_scale,
+            "min_face_size": self.min_face_size
         }
 
 
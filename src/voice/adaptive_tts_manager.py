@@ -19,14 +19,14 @@ Features:
 
 import asyncio
 import os
+import re
 import time
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Dict, List
-from collections import deque
-import hashlib
+from collections import OrderedDict
 
 # Try importing optional backends
 try:
@@ -71,6 +71,10 @@ except ImportError:
     _CONFIG_AVAILABLE = False
     logger.warning("Config not available, using default TTS settings")
 
+# SSML stripping patterns, compiled once for every backend's _strip_ssml()
+_BREAK_RE = re.compile(r'<break\s+time=[\'"][^\'"]*[\'"]\s*/>')
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
 def play_audio_data(audio_data: bytes, format: str = "mp3"):
     """
@@ -204,8 +208,8 @@ class GreetingCache:
         if cache_dir:
             cache_dir.mkdir(parents=True, exist_ok=True)
         
-        self.cache: Dict[str, CachedGreeting] = {}
-        self.access_order: deque = deque()
+        # Ordered least to most recently used; hits move entries to the end
+        self.cache: "OrderedDict[str, CachedGreeting]" = OrderedDict()
         
         # Statistics
         self.hits = 0
@@ -223,17 +227,16 @@ class GreetingCache:
         Returns:
             Cached audio data or None
         """
-        cache_key = self._get_cache_key(text)
+        # The text itself is the key; dict hashing of short strings is
+        # cheaper than deriving a digest key first
+        cached = self.cache.get(text)
         
-        if cache_key in self.cache:
-            cached = self.cache[cache_key]
+        if cached is not None:
             cached.access_count += 1
             cached.last_access = time.time()
             
-            # Update access order
-            if cache_key in self.access_order:
-                self.access_order.remove(cache_key)
-            self.access_order.append(cache_key)
+            # Mark as most recently used
+            self.cache.move_to_end(text)
             
             self.hits += 1
             logger.debug(f"Cache HIT: '{text[:50]}...'")
@@ -255,40 +258,21 @@ class GreetingCache:
             text: Greeting text
             audio_data: Generated audio data
         """
-        cache_key = self._get_cache_key(text)
-        
-        # Evict if cache full
-        if len(self.cache) >= self.max_size and cache_key not in self.cache:
-            self._evict_lru()
-        
-        # Store in cache
-        self.cache[cache_key] = CachedGreeting(
+        # Store in cache as most recently used
+        self.cache[text] = CachedGreeting(
             text=text,
             audio_data=audio_data,
             created_at=time.time()
         )
+        self.cache.move_to_end(text)
         
-        # Update access order
-        if cache_key in self.access_order:
-            self.access_order.remove(cache_key)
-        self.access_order.append(cache_key)
+        # Evict least recently used entries if cache is over capacity
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+            logger.debug("Evicted LRU cache entry")
         
         logger.debug(f"Cached: '{text[:50]}...'")
     
-    def _evict_lru(self):
-        """Remove least recently used item."""
-        if not self.access_order:
-            return
-        
-        lru_key = self.access_order.popleft()
-        if lru_key in self.cache:
-            del self.cache[lru_key]
-            logger.debug("Evicted LRU cache entry")
-    
-    def _get_cache_key(self, text: str) -> str:
-        """Generate cache key from text."""
-        return hashlib.md5(text.encode()).hexdigest()
-    
     def get_statistics(self) -> Dict:
         """Get cache statistics."""
         total_requests = self.hits + self.misses
@@ -306,7 +290,6 @@ class GreetingCache:
     def clear(self):
         """Clear all cached greetings."""
         self.cache.clear()
-        self.access_order.clear()
         logger.info("Cache cleared")
 
 
@@ -396,12 +379,11 @@ class OpenAITTSBackend:
     
     def _strip_ssml(self, text: str) -> str:
         """Remove SSML tags (OpenAI doesn't support them)."""
-        import re
-        # Remove <break> tags
-        text = re.sub(r'<break\s+time=[\'"][^\'"]*[\'"]\s*/>', ' ', text)
-        # Remove other tags
-        text = re.sub(r'<[^>]+>', '', text)
-        return text.strip()
+        # Plain-text greetings need no regex scan at all
+        if '<' not in text:
+            return text.strip()
+        # Remove <break> tags, then other tags
+        return _TAG_RE.sub('', _BREAK_RE.sub(' ', text)).strip()
     
     def _select_voice(self, template: GreetingTemplate) -> str:
         """
@@ -496,10 +478,9 @@ class Pyttsx3Backend:
     
     def _strip_ssml(self, text: str) -> str:
         """Remove SSML tags."""
-        import re
-        text = re.sub(r'<break\s+time=[\'"][^\'"]*[\'"]\s*/>', ' ', text)
-        text = re.sub(r'<[^>]+>', '', text)
-        return text.strip()
+        if '<' not in text:
+            return text.strip()
+        return _TAG_RE.sub('', _BREAK_RE.sub(' ', text)).strip()
 
 
 class AdaptiveTTSManager:
@@ -70,11 +70,14 @@ class GreetingTemplate:
     energy_level: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class GreetingContext:
     """
     Context information for greeting selection.
     
+    Slotted and mutable so a long-lived caller can reuse one instance;
+    select_greeting() only reads it during the call and keeps no reference.
+    
     Attributes:
         time_of_day: Current time period
         session_duration: Seconds since session start
@@ -194,6 +194,52 @@ def test_empty_frame():
     print(f"  ✓ Handles empty array gracefully")
 
 
+def test_detect_faces_cached():
+    """AC 2: Verify cached detection reuses results for unchanged frames."""
+    print("\n[TEST] Cached detection...")
+    
+    detector = FaceDetector()
+    test_img = create_test_image_with_face()
+    
+    faces = detector.detect_faces_cached(test_img)
+    assert faces == detector.detect_faces(test_img), "Cached result should match detect_faces"
+    
+    # Same frame: detection is skipped until max_age is reached
+    calls = []
+    detect = detector.detect_faces
+    detector.detect_faces = lambda frame: calls.append(1) or detect(frame)
+    for _ in range(3):
+        assert detector.detect_faces_cached(test_img, max_age=2) == faces
+    assert len(calls) == 1, f"Expected one detection pass, got {len(calls)}"
+    
+    # Changed frame: detection runs again
+    detector.detect_faces_cached(create_test_image_no_face())
+    assert len(calls) == 2, "Changed frame should trigger detection"
+    
+    assert detector.detect_faces_cached(None) == [], "Should return empty list for None frame"
+    
+    print(f"  ✓ Unchanged frames reuse cached faces")
+    print(f"  ✓ Changed frames trigger detection")
+
+
+def test_detect_faces_batch():
+    """AC 5: Verify batch detection matches per-frame detection."""
+    print("\n[TEST] Batch detection...")
+    
+    detector = FaceDetector()
+    frames = [create_test_image_with_face(), None, create_test_image_with_face((320, 240))]
+    
+    results = detector.detect_faces_batch(frames)
+    assert len(results) == len(frames), "Should return one result per frame"
+    assert results[1] == [], "None frame should give an empty list"
+    for frame, faces in zip(frames, results):
+        if frame is not None:
+            assert faces == detector.detect_faces(frame), "Batch result should match detect_faces"
+    
+    print(f"  ✓ One result list per frame")
+    print(f"  ✓ Results match single-frame detection")
+
+
 def test_draw_faces():
     """AC 3: Verify drawing bounding boxes works."""
     print("\n[TEST] Drawing bounding boxes...")
@@ -288,6 +334,8 @@ def run_all_tests():
         test_multiple_faces,
         test_no_faces,
         test_empty_frame,
+        test_detect_faces_cached,
+        test_detect_faces_batch,
         test_draw_faces,
         test_integration_with_camera,
         test_face_recognition_compatibility,
@@ -83,6 +83,56 @@ def test_face_encoding_consistency():
     return True
 
 
+def test_encode_faces_from_frame():
+    """Test batched encoding of several face locations in one frame (AC: 1)."""
+    print("\n[TEST] Batch encoding from frame...")
+    
+    encoder = FaceEncoder()
+    
+    frame = np.random.randint(0, 255, (240, 320, 3), dtype=np.uint8)
+    locations = [(10, 110, 110, 10), (50, 300, 200, 150), (100, 50, 100, 50)]
+    
+    encodings = encoder.encode_faces_from_frame(frame, locations, normalize=True)
+    
+    assert len(encodings) == len(locations), "Should return one entry per location"
+    assert encodings[2] is None, "Empty location should give None"
+    for encoding, location in zip(encodings[:2], locations[:2]):
+        expected = encoder.encode_face_from_frame(frame, location, normalize=True)
+        assert np.allclose(encoding, expected, atol=1e-5), "Batch encoding should match single encoding"
+    
+    print(f"✓ Encoded {len(locations)} locations in one call")
+    
+    return True
+
+
+def test_batch_encode_non_bgr_faces():
+    """Test grayscale and BGRA crops are not encoded from an unfilled batch row."""
+    print("\n[TEST] Batch encoding of non-BGR crops...")
+    
+    encoder = FaceEncoder()
+    
+    color = np.random.randint(0, 255, (80, 80, 3), dtype=np.uint8)
+    gray = np.random.randint(0, 255, (80, 80), dtype=np.uint8)
+    bgra = np.random.randint(0, 255, (80, 80, 4), dtype=np.uint8)
+    
+    encodings = encoder.batch_encode_faces([color, gray, bgra], normalize=True)
+    
+    assert len(encodings) == 3, "Should return one entry per image"
+    assert np.allclose(encodings[0], encoder.encode_face(color), atol=1e-5), \
+        "BGR crop should still be batch encoded"
+    for encoding, image in zip(encodings[1:], (gray, bgra)):
+        expected = encoder.encode_face(image)
+        if expected is None:
+            assert encoding is None, "Crop the model rejects should give None"
+        else:
+            assert np.allclose(encoding, expected, atol=1e-5), \
+                "Non-BGR crop should match single-image encoding"
+    
+    print(f"✓ Non-BGR crops handled like single-image encoding")
+    
+    return True
+
+
 def test_face_database_initialization():
     """Test FaceDatabase initialization (AC: 2)."""
     print("\n[TEST] FaceDatabase initialization...")
@@ -96,7 +146,7 @@ def test_face_database_initialization():
     
     info = db.get_info()
     assert info["num_faces"] == 0, "Should have 0 faces"
-    assert info["version"] == "1.0", "Version should be 1.0"
+    assert info["version"] == "3.0", "Version should be 3.0"
     
     print("✓ FaceDatabase initialized correctly")
     print(f"  Info: {info}")
@@ -131,6 +181,38 @@ def test_add_face_manual():
     return True
 
 
+def test_add_faces_batch():
+    """Test adding several faces in one batch."""
+    print("\n[TEST] Adding faces (batch)...")
+    
+    db = FaceDatabase()
+    db.add_face("Existing", np.random.randint(0, 255, (112, 112, 3), dtype=np.uint8), auto_detect=False)
+    db.get_encoding_matrix()  # Build the cache so the batch appends to it
+    
+    items = [
+        (f"Person{i}", np.random.randint(0, 255, (112, 112, 3), dtype=np.uint8))
+        for i in range(3)
+    ]
+    items.append(("Empty", np.zeros((0, 0, 3), dtype=np.uint8)))
+    
+    results = db.add_faces_batch(items, auto_detect=False)
+    
+    assert results == [True, True, True, False], "Empty image should be the only failure"
+    assert db.size() == 4, "Database should have 4 faces"
+    
+    # Cached matrix must match the per-person encodings
+    names, matrix = db.get_encoding_matrix()
+    assert names == ("Existing", "Person0", "Person1", "Person2"), "Names should keep insertion order"
+    assert matrix.shape == (4, 128) and matrix.dtype == np.float32, "Matrix should be (4, 128) float32"
+    for row, name in enumerate(names):
+        assert np.allclose(matrix[row], db.get_encoding(name)), f"Row {row} should match {name}"
+    
+    print("✓ Batch of faces added successfully")
+    print(f"  Results: {results}")
+    
+    return True
+
+
 def test_add_face_auto_detect():
     """Test adding face with auto-detection (AC: 4)."""
     print("\n[TEST] Adding face (auto-detect mode)...")
@@ -189,14 +271,19 @@ def test_database_save_and_load():
         
         print(f"✓ Database saved to {db_path}")
         
-        # Verify JSON format
-        with open(db_path, 'r') as f:
-            data = json.load(f)
+        # Verify file format (JSON header line + raw float32 matrix)
+        with open(db_path, 'rb') as f:
+            data = json.loads(f.readline())
+            body = f.read()
         
-        assert data["version"] == "1.0", "Version should be 1.0"
+        assert data["version"] == "3.0", "Version should be 3.0"
         assert data["num_faces"] == 2, "Should have 2 faces"
-        assert "Person1" in data["faces"], "Person1 should be in JSON"
-        assert "Person2" in data["faces"], "Person2 should be in JSON"
+        assert "Person1" in data["names"], "Person1 should be in JSON"
+        assert "Person2" in data["names"], "Person2 should be in JSON"
+        assert data["dtype"] == "float32", "Encodings should be stored as float32"
+        assert data["shape"] == [2, 128], "Encodings should be one (N, 128) matrix"
+        assert data["l2_normalized"] is True, "Encodings should be stored normalized"
+        assert len(body) == data["encodings_bytes"], "Header should record the matrix size"
         
         print(f"✓ JSON format validated ({data['num_faces']} faces)")
         
@@ -221,6 +308,41 @@ def test_database_save_and_load():
     return True
 
 
+def test_load_legacy_database():
+    """Test loading a version 1.0 database (AC: 5)."""
+    print("\n[TEST] Legacy database load...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "legacy_faces.json"
+        
+        encoding = np.random.randn(128)
+        encoding /= np.linalg.norm(encoding)
+        legacy = {
+            "version": "1.0",
+            "encoding_dim": 128,
+            "num_faces": 1,
+            "faces": {
+                "Legacy": {"encoding": encoding.tolist(), "metadata": {"source": "v1"}}
+            }
+        }
+        with open(db_path, 'w') as f:
+            json.dump(legacy, f, indent=2)
+        
+        db = FaceDatabase()
+        success = db.load_database(db_path)
+        
+        assert success, "Legacy database should load"
+        assert db.get_all_names() == ["Legacy"], "Legacy person should be loaded"
+        assert db.get_metadata("Legacy") == {"source": "v1"}, "Metadata should be loaded"
+        loaded = db.get_encoding("Legacy")
+        assert loaded.dtype == np.float32, "Encodings should be float32 in memory"
+        assert np.allclose(loaded, encoding, atol=1e-6), "Encoding should match"
+        
+        print("✓ Legacy database loaded")
+    
+    return True
+
+
 def test_get_all_encodings():
     """Test retrieving all encodings (AC: 7)."""
     print("\n[TEST] Get all encodings...")
@@ -298,10 +420,18 @@ def test_database_operations():
     assert "added_at" in metadata1, "Metadata should have added_at"
     
     # Test remove_face
+    enc2 = db.get_encoding("Person2")
     success = db.remove_face("Person1")
     assert success, "remove_face should succeed"
     assert db.size() == 1, "Size should be 1 after removal"
     assert "Person1" not in db.get_all_names(), "Person1 should be removed"
+    assert np.allclose(db.get_encoding("Person2"), enc2), "Remaining encoding should be unchanged"
+    
+    # Test set_encoding
+    new_enc = np.random.randn(128).astype(np.float32)
+    assert db.set_encoding("Person2", new_enc), "set_encoding should succeed"
+    assert np.allclose(db.get_encoding("Person2"), new_enc / np.linalg.norm(new_enc)), "Encoding should be replaced"
+    assert not db.set_encoding("NonExistent", new_enc), "set_encoding should fail for unknown person"
     
     # Test clear
     db.clear()
@@ -313,6 +443,32 @@ def test_database_operations():
     return True
 
 
+def test_remove_face_keeps_order():
+    """Test that removing a face keeps the insertion order of the rest."""
+    print("\n[TEST] Remove face order...")
+    
+    db = FaceDatabase()
+    for name in "ABCDE":
+        db.add_face(name, np.random.randint(0, 255, (112, 112, 3), dtype=np.uint8), auto_detect=False)
+    encodings = {name: db.get_encoding(name) for name in "ABCDE"}
+    
+    assert db.remove_face("A"), "remove_face should succeed"
+    assert db.get_all_names() == ["B", "C", "D", "E"], "Remaining names should keep insertion order"
+    
+    names, matrix = db.get_encoding_matrix()
+    assert names == ("B", "C", "D", "E"), "Matrix names should keep insertion order"
+    for row, name in enumerate(names):
+        assert np.allclose(matrix[row], encodings[name]), f"Row {row} should match {name}"
+    
+    assert db.remove_face("D"), "remove_face should succeed"
+    assert db.get_all_names() == ["B", "C", "E"], "Removing from the middle should keep order"
+    assert np.allclose(db.get_encoding("E"), encodings["E"]), "Shifted encoding should be unchanged"
+    
+    print("✓ Insertion order kept after removal")
+    
+    return True
+
+
 def test_backup_creation():
     """Test database backup creation (AC: 6)."""
     print("\n[TEST] Database backup...")
@@ -395,12 +551,17 @@ def run_all_tests():
         test_face_encoder_initialization,
         test_face_encoding_generation,
         test_face_encoding_consistency,
+        test_encode_faces_from_frame,
+        test_batch_encode_non_bgr_faces,
         test_face_database_initialization,
         test_add_face_manual,
+        test_add_faces_batch,
         test_add_face_auto_detect,
         test_database_save_and_load,
+        test_load_legacy_database,
         test_get_all_encodings,
         test_database_operations,
+        test_remove_face_keeps_order,
         test_backup_creation,
         test_edge_cases,
     ]
@@ -93,7 +93,7 @@ def test_cosine_similarity_calculation():
     # Add first encoding to database
     db.add_face("TestPerson", np.random.randint(0, 255, (112, 112, 3), dtype=np.uint8), auto_detect=False)
     # Override the encoding with our test encoding
-    db.database["TestPerson"]["encoding"] = encoding1.tolist()
+    db.set_encoding("TestPerson", encoding1)
     
     recognizer = FaceRecognizer(db, threshold=0.6)
     
@@ -142,7 +142,7 @@ def test_recognition_with_threshold():
     
     # Add to database
     db.add_face("Alice", np.random.randint(0, 255, (112, 112, 3), dtype=np.uint8), auto_detect=False)
-    db.database["Alice"]["encoding"] = encoding_alice.tolist()
+    db.set_encoding("Alice", encoding_alice)
     
     recognizer = FaceRecognizer(db, threshold=0.6)
     
@@ -244,6 +244,37 @@ def test_vectorized_recognition():
     return True
 
 
+def test_recognize_faces_arrays():
+    """Test that array results match the tuple-based vectorized results."""
+    print("\n[TEST] Array recognition results...")
+    
+    db = FaceDatabase()
+    for i in range(3):
+        face = np.random.randint(0, 255, (112, 112, 3), dtype=np.uint8)
+        db.add_face(f"Person{i}", face, auto_detect=False)
+    
+    recognizer = FaceRecognizer(db, threshold=0.6)
+    
+    # Known encodings (should match) plus random ones (should be unknown)
+    _, known = db.get_encoding_matrix()
+    test_encodings = np.vstack([known, np.random.randn(2, 128).astype(np.float32)])
+    
+    names, scores = recognizer.recognize_faces_arrays(test_encodings)
+    expected = recognizer.recognize_faces_vectorized(list(test_encodings))
+    
+    assert isinstance(scores, np.ndarray) and scores.shape == (5,), "Scores should be an (N,) array"
+    assert names == [name for name, _ in expected], "Names should match vectorized results"
+    assert np.allclose(scores, [conf for _, conf in expected]), "Scores should match vectorized results"
+    assert names[:3] == ["Person0", "Person1", "Person2"], "Known encodings should match themselves"
+    
+    empty_names, empty_scores = recognizer.recognize_faces_arrays([])
+    assert empty_names == [] and len(empty_scores) == 0, "Empty input should give empty results"
+    
+    print(f"✓ Array results match vectorized results")
+    
+    return True
+
+
 def test_recognition_performance():
     """Test recognition performance (AC: 5)."""
     print("\n[TEST] Recognition performance...")
@@ -276,6 +307,37 @@ def test_recognition_performance():
     return True
 
 
+def test_database_match_top_k():
+    """Test top-K similarity search on the database."""
+    print("\n[TEST] Database top-K match...")
+    
+    db = FaceDatabase()
+    encodings = {}
+    for name in ["Alice", "Bob", "Carol", "Dave"]:
+        db.add_face(name, np.random.randint(0, 255, (112, 112, 3), dtype=np.uint8), auto_detect=False)
+        encodings[name] = db.get_encoding(name)
+    
+    # Query close to Carol
+    query = encodings["Carol"] + 0.05 * np.random.randn(128).astype(np.float32)
+    
+    best = db.match(query)
+    assert len(best) == 1 and best[0][0] == "Carol", f"Best match should be Carol, got {best}"
+    
+    top3 = db.match(query, top_k=3)
+    assert len(top3) == 3, "Should return 3 matches"
+    assert top3[0][0] == "Carol", "Best match should come first"
+    scores = [score for _, score in top3]
+    assert scores == sorted(scores, reverse=True), "Matches should be sorted by similarity"
+    
+    assert len(db.match(query, top_k=10)) == 4, "top_k should be capped at database size"
+    assert FaceDatabase().match(query) == [], "Empty database should have no matches"
+    
+    print("✓ Top-K match working correctly")
+    print(f"  Top 3: {[(n, round(s, 3)) for n, s in top3]}")
+    
+    return True
+
+
 def test_empty_database():
     """Test recognition with empty database (AC: 3)."""
     print("\n[TEST] Empty database handling...")
@@ -408,7 +470,9 @@ def run_all_tests():
         test_recognition_with_threshold,
         test_multiple_faces_recognition,
         test_vectorized_recognition,
+        test_recognize_faces_arrays,
         test_recognition_performance,
+        test_database_match_top_k,
         test_empty_database,
         test_recognize_from_frame,
         test_unknown_face_handling,
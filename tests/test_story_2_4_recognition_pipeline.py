@@ -270,6 +270,32 @@ def test_get_stats():
     return True
 
 
+def test_min_face_size_filtering():
+    """Test that faces below min_face_size are dropped before encoding."""
+    print("\n[TEST] Min face size filtering...")
+    
+    class FixedDetector:
+        def detect_faces(self, frame):
+            # (top, right, bottom, left): one 40px face, one 200px face
+            return [(10, 50, 50, 10), (100, 400, 300, 200)]
+    
+    pipeline = RecognitionPipeline(
+        detector=FixedDetector(),
+        detection_scale=1.0,
+        min_face_size=80
+    )
+    frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+    results = pipeline.process_frame(frame)
+    
+    assert len(results) == 1, "Only the large face should be kept"
+    assert results[0][2] == (100, 400, 300, 200), "Kept bbox should be unchanged"
+    assert pipeline.get_stats()["min_face_size"] == 80
+    
+    print(f"✓ Small faces filtered before encoding")
+    
+    return True
+
+
 def test_logging():
     """Test recognition event logging (AC: 6)."""
     print("\n[TEST] Recognition event logging...")
@@ -363,6 +389,7 @@ def run_all_tests():
         test_performance_fps,
         test_draw_results,
         test_get_stats,
+        test_min_face_size_filtering,
         test_logging,
         test_database_loading
     ]
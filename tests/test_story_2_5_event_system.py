@@ -97,6 +97,32 @@ def test_debouncing_person_recognized():
     return True
 
 
+def test_debounce_single_frame():
+    """Test debounce_frames=1 fires on the first sighting (AC: 2)."""
+    print("\n[TEST] Debouncing - single frame...")
+    
+    manager = EventManager(debounce_frames=1)
+    
+    # Frame 1: Alice appears and the event triggers immediately
+    results = [("Alice", 0.85, (100, 200, 300, 100))]
+    events = manager.process_recognition_results(results, frame_number=1)
+    assert len(events) == 1, "Should trigger event on frame 1"
+    assert events[0].person_name == "Alice"
+    assert events[0].frame_number == 1
+    
+    # Frame 2: no duplicate
+    events = manager.process_recognition_results(results, frame_number=2)
+    assert len(events) == 0, "Should not trigger duplicate event"
+    
+    # debounce_frames=2 still waits for the second sighting
+    manager = EventManager(debounce_frames=2)
+    assert len(manager.process_recognition_results(results, frame_number=1)) == 0
+    assert len(manager.process_recognition_results(results, frame_number=2)) == 1
+    
+    print(f"✓ debounce_frames=1 triggers on first sighting")
+    return True
+
+
 def test_debouncing_person_unknown():
     """Test debouncing for PERSON_UNKNOWN (AC: 2, 3)."""
     print("\n[TEST] Debouncing - PERSON_UNKNOWN...")
@@ -119,6 +145,30 @@ def test_debouncing_person_unknown():
     return True
 
 
+def test_duplicate_name_in_one_frame():
+    """Test two faces with the same name in a single frame (AC: 2)."""
+    print("\n[TEST] Duplicate name in one frame...")
+    
+    manager = EventManager(debounce_frames=2)
+    
+    # Two unknown faces in the first frame count as two sightings
+    results = [
+        ("unknown", 0.40, (150, 350, 400, 200)),
+        ("unknown", 0.45, (160, 360, 410, 210)),
+    ]
+    events = manager.process_recognition_results(results, frame_number=1)
+    assert len(events) == 1
+    assert events[0].event_type == EventType.PERSON_UNKNOWN
+    assert manager.get_stats()["currently_tracked"] == 1
+    
+    # No duplicate on the next frame
+    events = manager.process_recognition_results(results, frame_number=2)
+    assert len(events) == 0
+    
+    print(f"✓ Duplicate names in one frame tracked as one person")
+    return True
+
+
 def test_person_departed_event():
     """Test PERSON_DEPARTED event generation (AC: 1, 3)."""
     print("\n[TEST] PERSON_DEPARTED event...")
@@ -405,7 +455,9 @@ def run_all_tests():
         test_event_types,
         test_recognition_event_structure,
         test_debouncing_person_recognized,
+        test_debounce_single_frame,
         test_debouncing_person_unknown,
+        test_duplicate_name_in_one_frame,
         test_person_departed_event,
         test_no_faces_event,
         test_multiple_people_debouncing,